@@ -0,0 +1,25 @@
+# Declarations for compiling parser.py with Cython (see setup.py). The parser
+# itself stays plain Python, only the token iterator is turned into an
+# extension type, since its methods are called for nearly every token.
+
+cdef class TokenIterator:
+    cdef public object filename
+    cdef public object coding
+    cdef public object next_type
+    cdef public object next_string
+    cdef tuple _values
+    cdef object _types
+    cdef list _strings
+    cdef Py_ssize_t _length
+    cdef Py_ssize_t _index
+
+    cpdef bint check(self, token_type, token_name=*, Py_ssize_t lookahead=*)
+    cpdef bint check_any(self, token_type, token_names, Py_ssize_t lookahead=*)
+    cpdef tuple accept(self, token_type, token_name=*, result_name=*, error_msg=*)
+    cpdef tuple accept_op(self, op)
+    cpdef tuple accept_keyword(self, keyword)
+    cpdef tuple accept_empty(self, token_type)
+    cpdef tuple peek(self, Py_ssize_t lookahead=*)
+    cpdef advance(self)
+    cpdef bint check_test(self, Py_ssize_t lookahead=*)
+    cpdef bint check_expr(self, Py_ssize_t lookahead=*)
@@ -7,7 +7,9 @@ import token
 import tokenize
 import symbol
 import re
+from array import array
 from StringIO import StringIO
+import cStringIO
 import pycep.tokenizer
 
 def suite(source, totuple=False):
@@ -75,10 +77,17 @@ def suite(source, totuple=False):
         * Future Statement Definitions: https://docs.python.org/2/library/__future__.html
     """
     # pylint: disable=W0603,C0103
-    global future_print_function
+    global future_print_function, keywords
     future_print_function = False
+    keywords = KEYWORDS
+
+    # the type is part of the key, a unicode source gives unicode leaves
+    key = ("suite", type(source), source, totuple)
+
+    if key in _cache:
+        return _cache[key]
 
-    tokens = TokenIterator(pycep.tokenizer.generate_tokens(StringIO(source).readline))
+    tokens = TokenIterator(pycep.tokenizer.generate_tokens(_readline(source)))
 
     if tokens.coding:
         result = _encoding_decl(tokens)
@@ -87,50 +96,94 @@ def suite(source, totuple=False):
         result = _file_input(tokens)
 
     if totuple:
-        return listit(result)
+        return _cache_result(key, listit(result))
     else:
-        return parser.sequence2st(result)
+        return _cache_result(key, parser.sequence2st(result))
 
 def expr(source, totuple=False):
-    tokens = TokenIterator(pycep.tokenizer.generate_tokens(StringIO(source).readline))
+    # pylint: disable=W0603,C0103
+    global future_print_function, keywords
+    future_print_function = False
+    keywords = KEYWORDS
+
+    key = ("expr", type(source), source, totuple)
+
+    if key in _cache:
+        return _cache[key]
+
+    tokens = TokenIterator(pycep.tokenizer.generate_tokens(_readline(source)))
 
     result = _eval_input(tokens)
 
     if totuple:
-        return listit(result)
+        return _cache_result(key, listit(result))
+    else:
+        return _cache_result(key, parser.sequence2st(result))
+
+# Parse trees of already parsed sources. Both the tuples and the ``parser.st``
+# objects are immutable, so the same tree can be returned to every caller
+# parsing the same source again. The tree only depends on the source, since
+# suite() and expr() reset the print_function mode before looking it up. Once
+# _MAXCACHE trees are stored, the whole cache is cleared.
+_cache = {}
+_MAXCACHE = 100
+
+def _cache_result(key, result):
+    """Remember ``result`` as the parse tree for ``key`` and return it."""
+    if len(_cache) >= _MAXCACHE:
+        _cache.clear()
+
+    _cache[key] = result
+
+    return result
+
+def _readline(source):
+    """Return a ``readline`` function over ``source`` for the tokenizer. Byte
+    strings are read with ``cStringIO``, whose ``readline`` is implemented in
+    C, unicode strings (which ``cStringIO`` cannot hold) with ``StringIO``."""
+    if isinstance(source, unicode):
+        return StringIO(source).readline
     else:
-        return parser.sequence2st(result)
+        return cStringIO.StringIO(source).readline
 
 def listit(tup):
-    """Recursively convert list-of-lists to tuples-of-tuples"""
-    if isinstance(tup, (list, tuple)):
-        return tuple([listit(el) for el in tup])
+    """Recursively convert list-of-lists to tuples-of-tuples. Leaves of the
+    parse tree already are tuples and are returned as they are."""
+    if isinstance(tup, list):
+        return _listit(tup)
     else:
         return tup
 
+def _listit(node):
+    """Convert the list ``node`` and its descendants. Only lists are recursed
+    into, symbol numbers and leaves are taken over without another call."""
+    return tuple([_listit(el) if type(el) is list else el for el in node])
+
 def check_future_statements(result):
     # pylint: disable=W0603,C0103
-    global future_print_function
+    global future_print_function, keywords
 
     modules = []
 
-    if result[2][0] == symbol.dotted_name and result[2][1][0] == token.NAME:
+    if result[2][0] == _S_DOTTED_NAME and result[2][1][0] == _NAME:
         if result[2][1][1] == "__future__":
-            if result[4][0] == symbol.import_as_names:
+            if result[4][0] == _S_IMPORT_AS_NAMES:
                 modules = result[4][1::2] # every second element is a module name
-            elif len(result) > 5 and result[5][0] == symbol.import_as_names:
+            elif len(result) > 5 and result[5][0] == _S_IMPORT_AS_NAMES:
                 modules = result[5][1::2] # every second element is a module name
 
     for module in modules:
         if module[1][1] == "print_function":
             future_print_function = True
-            if "print" in KEYWORDS:
-                KEYWORDS.remove("print")
+            keywords = PRINT_FUNCTION_KEYWORDS
+
+KEYWORDS = frozenset(["and", "as", "assert", "break", "class", "continue", "def",
+                      "del", "elif", "else", "except", "exec", "finally", "for", "from",
+                      "global", "if", "import", "in", "is", "lambda", "not", "or", "pass",
+                      "print", "raise", "return", "try", "while", "with", "yield"])
 
-KEYWORDS = ["and", "as", "assert", "break", "class", "continue", "def",
-            "del", "elif", "else", "except", "exec", "finally", "for", "from",
-            "global", "if", "import", "in", "is", "lambda", "not", "or", "pass",
-            "print", "raise", "return", "try", "while", "with", "yield"]
+# after "from __future__ import print_function", print is an ordinary name
+PRINT_FUNCTION_KEYWORDS = KEYWORDS - frozenset(["print"])
 
 ENCODING_ALIASES = {
     "iso-latin-1-unix": "iso-8859-1",
@@ -139,6 +192,216 @@ ENCODING_ALIASES = {
 
 # pylint: disable=C0103
 future_print_function = False
+keywords = KEYWORDS
+
+# Returned by TokenIterator.peek() when looking past the end of the input
+_NO_TOKEN = (None, None)
+
+# Token and symbol numbers are bound to module level names, which saves an
+# attribute lookup on the ``token`` and ``symbol`` modules on every access.
+_AMPER = token.AMPER
+_AMPEREQUAL = token.AMPEREQUAL
+_AT = token.AT
+_BACKQUOTE = token.BACKQUOTE
+_CIRCUMFLEX = token.CIRCUMFLEX
+_CIRCUMFLEXEQUAL = token.CIRCUMFLEXEQUAL
+_COLON = token.COLON
+_COMMA = token.COMMA
+_DEDENT = token.DEDENT
+_DOT = token.DOT
+_DOUBLESLASH = token.DOUBLESLASH
+_DOUBLESLASHEQUAL = token.DOUBLESLASHEQUAL
+_DOUBLESTAR = token.DOUBLESTAR
+_DOUBLESTAREQUAL = token.DOUBLESTAREQUAL
+_ENDMARKER = token.ENDMARKER
+_EQEQUAL = token.EQEQUAL
+_EQUAL = token.EQUAL
+_GREATER = token.GREATER
+_GREATEREQUAL = token.GREATEREQUAL
+_INDENT = token.INDENT
+_LBRACE = token.LBRACE
+_LEFTSHIFT = token.LEFTSHIFT
+_LEFTSHIFTEQUAL = token.LEFTSHIFTEQUAL
+_LESS = token.LESS
+_LESSEQUAL = token.LESSEQUAL
+_LPAR = token.LPAR
+_LSQB = token.LSQB
+_MINEQUAL = token.MINEQUAL
+_MINUS = token.MINUS
+_NAME = token.NAME
+_NEWLINE = token.NEWLINE
+_NL = tokenize.NL
+_NOTEQUAL = token.NOTEQUAL
+_NUMBER = token.NUMBER
+_N_TOKENS = token.N_TOKENS
+_OP = token.OP
+_PERCENT = token.PERCENT
+_PERCENTEQUAL = token.PERCENTEQUAL
+_PLUS = token.PLUS
+_PLUSEQUAL = token.PLUSEQUAL
+_RBRACE = token.RBRACE
+_RIGHTSHIFT = token.RIGHTSHIFT
+_RIGHTSHIFTEQUAL = token.RIGHTSHIFTEQUAL
+_RPAR = token.RPAR
+_RSQB = token.RSQB
+_SEMI = token.SEMI
+_SLASH = token.SLASH
+_SLASHEQUAL = token.SLASHEQUAL
+_STAR = token.STAR
+_STAREQUAL = token.STAREQUAL
+_STRING = token.STRING
+_TILDE = token.TILDE
+_VBAR = token.VBAR
+_VBAREQUAL = token.VBAREQUAL
+
+_S_AND_EXPR = symbol.and_expr
+_S_AND_TEST = symbol.and_test
+_S_ARGLIST = symbol.arglist
+_S_ARGUMENT = symbol.argument
+_S_ARITH_EXPR = symbol.arith_expr
+_S_ASSERT_STMT = symbol.assert_stmt
+_S_ATOM = symbol.atom
+_S_AUGASSIGN = symbol.augassign
+_S_BREAK_STMT = symbol.break_stmt
+_S_CLASSDEF = symbol.classdef
+_S_COMP_FOR = symbol.comp_for
+_S_COMP_IF = symbol.comp_if
+_S_COMP_ITER = symbol.comp_iter
+_S_COMP_OP = symbol.comp_op
+_S_COMPARISON = symbol.comparison
+_S_COMPOUND_STMT = symbol.compound_stmt
+_S_CONTINUE_STMT = symbol.continue_stmt
+_S_DECORATED = symbol.decorated
+_S_DECORATOR = symbol.decorator
+_S_DECORATORS = symbol.decorators
+_S_DEL_STMT = symbol.del_stmt
+_S_DICTORSETMAKER = symbol.dictorsetmaker
+_S_DOTTED_AS_NAME = symbol.dotted_as_name
+_S_DOTTED_AS_NAMES = symbol.dotted_as_names
+_S_DOTTED_NAME = symbol.dotted_name
+_S_ENCODING_DECL = symbol.encoding_decl
+_S_EVAL_INPUT = symbol.eval_input
+_S_EXCEPT_CLAUSE = symbol.except_clause
+_S_EXEC_STMT = symbol.exec_stmt
+_S_EXPR = symbol.expr
+_S_EXPR_STMT = symbol.expr_stmt
+_S_EXPRLIST = symbol.exprlist
+_S_FACTOR = symbol.factor
+_S_FILE_INPUT = symbol.file_input
+_S_FLOW_STMT = symbol.flow_stmt
+_S_FOR_STMT = symbol.for_stmt
+_S_FPDEF = symbol.fpdef
+_S_FPLIST = symbol.fplist
+_S_FUNCDEF = symbol.funcdef
+_S_GLOBAL_STMT = symbol.global_stmt
+_S_IF_STMT = symbol.if_stmt
+_S_IMPORT_AS_NAME = symbol.import_as_name
+_S_IMPORT_AS_NAMES = symbol.import_as_names
+_S_IMPORT_FROM = symbol.import_from
+_S_IMPORT_NAME = symbol.import_name
+_S_IMPORT_STMT = symbol.import_stmt
+_S_LAMBDEF = symbol.lambdef
+_S_LIST_FOR = symbol.list_for
+_S_LIST_IF = symbol.list_if
+_S_LIST_ITER = symbol.list_iter
+_S_LISTMAKER = symbol.listmaker
+_S_NOT_TEST = symbol.not_test
+_S_OLD_LAMBDEF = symbol.old_lambdef
+_S_OLD_TEST = symbol.old_test
+_S_OR_TEST = symbol.or_test
+_S_PARAMETERS = symbol.parameters
+_S_PASS_STMT = symbol.pass_stmt
+_S_POWER = symbol.power
+_S_PRINT_STMT = symbol.print_stmt
+_S_RAISE_STMT = symbol.raise_stmt
+_S_RETURN_STMT = symbol.return_stmt
+_S_SHIFT_EXPR = symbol.shift_expr
+_S_SIMPLE_STMT = symbol.simple_stmt
+_S_SINGLE_INPUT = symbol.single_input
+_S_SLICEOP = symbol.sliceop
+_S_SMALL_STMT = symbol.small_stmt
+_S_STMT = symbol.stmt
+_S_SUBSCRIPT = symbol.subscript
+_S_SUBSCRIPTLIST = symbol.subscriptlist
+_S_SUITE = symbol.suite
+_S_TERM = symbol.term
+_S_TEST = symbol.test
+_S_TESTLIST = symbol.testlist
+_S_TESTLIST1 = symbol.testlist1
+_S_TESTLIST_COMP = symbol.testlist_comp
+_S_TESTLIST_SAFE = symbol.testlist_safe
+_S_TRAILER = symbol.trailer
+_S_TRY_STMT = symbol.try_stmt
+_S_VARARGSLIST = symbol.varargslist
+_S_WHILE_STMT = symbol.while_stmt
+_S_WITH_ITEM = symbol.with_item
+_S_WITH_STMT = symbol.with_stmt
+_S_XOR_EXPR = symbol.xor_expr
+_S_YIELD_EXPR = symbol.yield_expr
+_S_YIELD_STMT = symbol.yield_stmt
+
+# Operators of comp_op, term and augassign, mapped to the leaf that the parse
+# tree reports for them (the tokenizer reports all of them as OP). The leaves
+# are shared, so that accepting an operator does not build a new tuple.
+_COMP_OPS = {"<": (_LESS, "<"), ">": (_GREATER, ">"), "==": (_EQEQUAL, "=="),
+             ">=": (_GREATEREQUAL, ">="), "<=": (_LESSEQUAL, "<="),
+             "<>": (_NOTEQUAL, "<>"), "!=": (_NOTEQUAL, "!=")}
+_TERM_OPS = {"*": (_STAR, "*"), "/": (_SLASH, "/"), "%": (_PERCENT, "%"),
+             "//": (_DOUBLESLASH, "//")}
+_AUGASSIGN_OPS = {"+=": (_PLUSEQUAL, "+="), "-=": (_MINEQUAL, "-="),
+                  "*=": (_STAREQUAL, "*="), "/=": (_SLASHEQUAL, "/="),
+                  "%=": (_PERCENTEQUAL, "%="), "&=": (_AMPEREQUAL, "&="),
+                  "|=": (_VBAREQUAL, "|="), "^=": (_CIRCUMFLEXEQUAL, "^="),
+                  "<<=": (_LEFTSHIFTEQUAL, "<<="), ">>=": (_RIGHTSHIFTEQUAL, ">>="),
+                  "**=": (_DOUBLESTAREQUAL, "**="), "//=": (_DOUBLESLASHEQUAL, "//=")}
+
+# Leaves of the other operators, which the parse functions accept by name
+_OP_LEAVES = {",": (_COMMA, ","), ":": (_COLON, ":"), "(": (_LPAR, "("),
+              ")": (_RPAR, ")"), "[": (_LSQB, "["), "]": (_RSQB, "]"),
+              "{": (_LBRACE, "{"), "}": (_RBRACE, "}"), ".": (_DOT, "."),
+              "`": (_BACKQUOTE, "`"), "=": (_EQUAL, "="), ";": (_SEMI, ";"),
+              "@": (_AT, "@"), "*": (_STAR, "*"), "**": (_DOUBLESTAR, "**"),
+              "+": (_PLUS, "+"), "-": (_MINUS, "-"), "~": (_TILDE, "~"),
+              ">>": (_RIGHTSHIFT, ">>")}
+
+# Leaves of the keywords, shared the same way
+_KEYWORD_LEAVES = dict((keyword, (_NAME, keyword)) for keyword in KEYWORDS)
+
+# The parse tree reports every NEWLINE, including the ones Python's parser
+# makes up at the end of a statement or file, with an empty string
+_NEWLINE_LEAF = (_NEWLINE, "")
+
+# Leaves of the tokens which the parse tree reports with an empty string,
+# see TokenIterator.accept_empty()
+_EMPTY_LEAVES = {_NEWLINE: _NEWLINE_LEAF, _INDENT: (_INDENT, ""),
+                 _DEDENT: (_DEDENT, ""), _ENDMARKER: (_ENDMARKER, "")}
+
+# FIRST sets of test and expr: the operators they can start with, and the
+# token types of which any token can start them (for expr, except keywords)
+_FIRST_OPS = frozenset(["+", "-", "~", "(", "[", "{", "`"])
+_FIRST_TYPES = frozenset([_NAME, _NUMBER, _STRING])
+
+# token types a small_stmt can start with
+_FIRST_SMALL_STMT_TYPES = frozenset([_NAME, _OP, _NUMBER, _STRING])
+
+# The binary operator levels from expr down to term, outermost first. Each
+# level has the same shape ``level: next_level (op next_level)*`` and is only
+# described by its symbol and its operators, see _expr()
+_BINARY_LEVELS = ((_S_EXPR, {"|": (_VBAR, "|")}),
+                  (_S_XOR_EXPR, {"^": (_CIRCUMFLEX, "^")}),
+                  (_S_AND_EXPR, {"&": (_AMPER, "&")}),
+                  (_S_SHIFT_EXPR, {"<<": (_LEFTSHIFT, "<<"), ">>": (_RIGHTSHIFT, ">>")}),
+                  (_S_ARITH_EXPR, {"+": (_PLUS, "+"), "-": (_MINUS, "-")}),
+                  (_S_TERM, _TERM_OPS))
+
+# A test which is a single NAME, NUMBER or STRING has one node on each level
+# between test and atom. These are their symbols, innermost first, see _test()
+_ATOM_TEST_LEVELS = ((_S_POWER, _S_FACTOR) +
+                     tuple(sym for sym, ops in reversed(_BINARY_LEVELS)) +
+                     (_S_COMPARISON, _S_NOT_TEST, _S_AND_TEST, _S_OR_TEST))
+
+# operators which may follow a test, but cannot continue it
+_TEST_FOLLOW_OPS = frozenset([",", ")", "]", "}", ":", "=", ";", "`"] + _AUGASSIGN_OPS.keys())
 
 def _single_input(tokens):
     """Parse a single input.
@@ -147,16 +410,19 @@ def _single_input(tokens):
 
         single_input: NEWLINE | simple_stmt | compound_stmt NEWLINE
     """
-    result = [symbol.single_input]
+    result = [_S_SINGLE_INPUT]
 
-    if tokens.check(token.NEWLINE):
-        result.append(tokens.accept(token.NEWLINE, ""))
+    tok_type = tokens.next_type
+    tok_string = tokens.next_string
 
-    elif tokens.check(token.NAME, ("if", "while", "for", "try", "with", "def", "class")) or \
-        tokens.check(token.OP, "@"):
+    if tok_type == _NEWLINE:
+        result.append(tokens.accept(_NEWLINE, ""))
+
+    elif (tok_type == _NAME and tok_string in _COMPOUND_STMTS) or \
+        (tok_type == _OP and tok_string == "@"):
 
         result.append(_compound_stmt(tokens))
-        result.append(tokens.accept(token.NEWLINE, "", result_name=""))
+        result.append(tokens.accept(_NEWLINE, "", result_name=""))
     else:
         result.append(_simple_stmt(tokens))
 
@@ -169,23 +435,25 @@ def _file_input(tokens):
 
         file_input: (NEWLINE | stmt)* ENDMARKER
     """
-    result = [symbol.file_input]
+    result = [_S_FILE_INPUT]
 
-    try:
-        while not tokens.check(token.ENDMARKER):
-            if tokens.check(token.NEWLINE):
-                result.append(tokens.accept(token.NEWLINE, result_name=""))
-            else:
-                result.append(_stmt(tokens))
-    except StopIteration:
-        pass # raise "Expecting ENDMARKER" in next block
+    tok_type = tokens.next_type
+
+    while tok_type != _ENDMARKER:
+        if tok_type == _NEWLINE:
+            tokens.advance()
+            result.append(_NEWLINE_LEAF)
+        else:
+            result.append(_stmt(tokens))
+
+        tok_type = tokens.next_type
 
     # No trailing NEWLINE defined in grammar, but Python's parser appends it,
     # if the file is not empty. Imitate this behavior
     if len(result) > 1:
-        result.append((token.NEWLINE, ""))
+        result.append(_NEWLINE_LEAF)
 
-    result.append(tokens.accept(token.ENDMARKER, result_name=""))
+    result.append(tokens.accept_empty(_ENDMARKER))
 
     return result
 
@@ -196,19 +464,17 @@ def _eval_input(tokens):
 
         eval_input: testlist NEWLINE* ENDMARKER
     """
-    result = [symbol.eval_input]
+    result = [_S_EVAL_INPUT, _testlist(tokens)]
 
-    result.append(_testlist(tokens))
-
-    if tokens.check(token.NEWLINE):
-        while tokens.check(token.NEWLINE):
-            result.append(tokens.accept(token.NEWLINE, "", result_name=""))
+    if tokens.check(_NEWLINE):
+        while tokens.check(_NEWLINE):
+            result.append(tokens.accept(_NEWLINE, "", result_name=""))
     else:
         # Python's parser always appends a trailing NEWLINE, even if it is
         # omitted from the input. Imitate this behavior.
-        result.append((token.NEWLINE, ""))
+        result.append((_NEWLINE, ""))
 
-    result.append(tokens.accept(token.ENDMARKER, "", result_name=""))
+    result.append(tokens.accept(_ENDMARKER, "", result_name=""))
 
     return result
 
@@ -219,20 +485,18 @@ def _decorator(tokens):
 
         decorator: '@' dotted_name [ '(' [arglist] ')' ] NEWLINE
     """
-    result = [symbol.decorator]
-
-    result.append(tokens.accept(token.OP, "@", result_token=token.AT))
-    result.append(_dotted_name(tokens))
+    result = [_S_DECORATOR, tokens.accept_op("@"),
+              _dotted_name(tokens)]
 
-    if tokens.check(token.OP, "("):
-        result.append(tokens.accept(token.OP, "(", result_token=token.LPAR))
+    if tokens.check(_OP, "("):
+        result.append(tokens.accept_op("("))
 
-        if not tokens.check(token.OP, ")"):
+        if not tokens.check(_OP, ")"):
             result.append(_arglist(tokens))
 
-        result.append(tokens.accept(token.OP, ")", result_token=token.RPAR))
+        result.append(tokens.accept_op(")"))
 
-    result.append(tokens.accept(token.NEWLINE, result_name=""))
+    result.append(tokens.accept_empty(_NEWLINE))
 
     return result
 
@@ -243,11 +507,9 @@ def _decorators(tokens):
 
         decorators: decorator+
     """
-    result = [symbol.decorators]
+    result = [_S_DECORATORS, _decorator(tokens)]
 
-    result.append(_decorator(tokens))
-
-    while tokens.check(token.OP, "@"):
+    while tokens.check(_OP, "@"):
         result.append(_decorator(tokens))
 
     return result
@@ -259,13 +521,11 @@ def _decorated(tokens):
 
         decorated: decorators (classdef | funcdef)
     """
-    result = [symbol.decorated]
-
-    result.append(_decorators(tokens))
+    result = [_S_DECORATED, _decorators(tokens)]
 
-    if tokens.check(token.NAME, "class"):
+    if tokens.check(_NAME, "class"):
         result.append(_classdef(tokens))
-    elif tokens.check(token.NAME, "def"):
+    elif tokens.check(_NAME, "def"):
         result.append(_funcdef(tokens))
     else:
         tokens.error("Expecting (classdef | funcdef)")
@@ -279,15 +539,9 @@ def _funcdef(tokens):
 
         funcdef: 'def' NAME parameters ':' suite
     """
-    result = [symbol.funcdef]
-
-    result.append(tokens.accept(token.NAME, "def"))
-    result.append(tokens.accept(token.NAME))
-    result.append(_parameters(tokens))
-    result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
-    result.append(_suite(tokens))
-
-    return result
+    return [_S_FUNCDEF, tokens.accept_keyword("def"), tokens.accept(_NAME),
+            _parameters(tokens), tokens.accept_op(":"),
+            _suite(tokens)]
 
 def _parameters(tokens):
     """Parse a parameter list.
@@ -296,14 +550,12 @@ def _parameters(tokens):
 
         parameters: '(' [varargslist] ')'
     """
-    result = [symbol.parameters]
-
-    result.append(tokens.accept(token.OP, "(", result_token=token.LPAR))
+    result = [_S_PARAMETERS, tokens.accept_op("(")]
 
-    if not tokens.check(token.OP, ")"):
+    if not tokens.check(_OP, ")"):
         result.append(_varargslist(tokens))
 
-    result.append(tokens.accept(token.OP, ")", result_token=token.RPAR))
+    result.append(tokens.accept_op(")"))
 
     return result
 
@@ -358,53 +610,53 @@ def _varargslist(tokens):
     #                 '*' NAME [',' '**' NAME] |
     #                 '**' NAME)
     #
-    result = [symbol.varargslist]
+    result = [_S_VARARGSLIST]
 
-    if tokens.check(token.NAME) or tokens.check(token.OP, "("):
+    if tokens.check(_NAME) or tokens.check(_OP, "("):
         result.append(_fpdef(tokens))
 
-        if tokens.check(token.OP, "="):
-            result.append(tokens.accept(token.OP, "=", result_token=token.EQUAL))
+        if tokens.check(_OP, "="):
+            result.append(tokens.accept_op("="))
             result.append(_test(tokens))
 
-        while tokens.check(token.OP, ",") and (tokens.check(token.NAME, lookahead=2) or \
-            tokens.check(token.OP, "(", lookahead=2)):
+        while tokens.check(_OP, ",") and (tokens.check(_NAME, lookahead=2) or \
+            tokens.check(_OP, "(", lookahead=2)):
 
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+            result.append(tokens.accept_op(","))
             result.append(_fpdef(tokens))
 
-            if tokens.check(token.OP, "="):
-                result.append(tokens.accept(token.OP, "=", result_token=token.EQUAL))
+            if tokens.check(_OP, "="):
+                result.append(tokens.accept_op("="))
                 result.append(_test(tokens))
 
-        if tokens.check(token.OP, ","):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+        if tokens.check(_OP, ","):
+            result.append(tokens.accept_op(","))
 
-            if tokens.check(token.OP, "*"):
-                result.append(tokens.accept(token.OP, "*", result_token=token.STAR))
-                result.append(tokens.accept(token.NAME))
+            if tokens.check(_OP, "*"):
+                result.append(tokens.accept_op("*"))
+                result.append(tokens.accept(_NAME))
 
-                if tokens.check(token.OP, ","):
-                    result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-                    result.append(tokens.accept(token.OP, "**", result_token=token.DOUBLESTAR))
-                    result.append(tokens.accept(token.NAME))
+                if tokens.check(_OP, ","):
+                    result.append(tokens.accept_op(","))
+                    result.append(tokens.accept_op("**"))
+                    result.append(tokens.accept(_NAME))
 
-            elif tokens.check(token.OP, "**"):
-                result.append(tokens.accept(token.OP, "**", result_token=token.DOUBLESTAR))
-                result.append(tokens.accept(token.NAME))
+            elif tokens.check(_OP, "**"):
+                result.append(tokens.accept_op("**"))
+                result.append(tokens.accept(_NAME))
 
-    elif tokens.check(token.OP, "*"):
-        result.append(tokens.accept(token.OP, "*", result_token=token.STAR))
-        result.append(tokens.accept(token.NAME))
+    elif tokens.check(_OP, "*"):
+        result.append(tokens.accept_op("*"))
+        result.append(tokens.accept(_NAME))
 
-        if tokens.check(token.OP, ","):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-            result.append(tokens.accept(token.OP, "**", result_token=token.DOUBLESTAR))
-            result.append(tokens.accept(token.NAME))
+        if tokens.check(_OP, ","):
+            result.append(tokens.accept_op(","))
+            result.append(tokens.accept_op("**"))
+            result.append(tokens.accept(_NAME))
 
-    elif tokens.check(token.OP, "**"):
-        result.append(tokens.accept(token.OP, "**", result_token=token.DOUBLESTAR))
-        result.append(tokens.accept(token.NAME))
+    elif tokens.check(_OP, "**"):
+        result.append(tokens.accept_op("**"))
+        result.append(tokens.accept(_NAME))
 
     else:
         tokens.error()
@@ -418,19 +670,13 @@ def _fpdef(tokens):
 
         fpdef: NAME | '(' fplist ')'
     """
-    result = [symbol.fpdef]
-
-    if tokens.check(token.NAME):
-        result.append(tokens.accept(token.NAME))
-    elif tokens.check(token.OP, "("):
-        result.append(tokens.accept(token.OP, "(", result_token=token.LPAR))
-        result.append(_fplist(tokens))
-        result.append(tokens.accept(token.OP, ")", result_token=token.RPAR))
+    if tokens.check(_NAME):
+        return [_S_FPDEF, tokens.accept(_NAME)]
+    elif tokens.check(_OP, "("):
+        return [_S_FPDEF, tokens.accept_op("("), _fplist(tokens), tokens.accept_op(")")]
     else:
         tokens.error("Expecting NAME | '(' fplist ')'")
 
-    return result
-
 def _fplist(tokens):
     """Parse a function parameter list
 
@@ -438,19 +684,18 @@ def _fplist(tokens):
 
         fplist: fpdef (',' fpdef)* [',']
     """
-    result = [symbol.fplist]
+    result = [_S_FPLIST, _fpdef(tokens)]
 
-    result.append(_fpdef(tokens))
+    while tokens.check(_OP, ","):
+        result.append(tokens.accept_op(","))
+        tok_type = tokens.next_type
+        tok_string = tokens.next_string
 
-    while tokens.check(token.OP, ",")  and tokens.check(token.NAME, lookahead=2) or \
-            tokens.check(token.OP, "(", lookahead=2):
+        if not (tok_type == _NAME or tok_type == _OP and tok_string == "("):
+            break
 
-        result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
         result.append(_fpdef(tokens))
 
-    if tokens.check(token.OP, ","):
-        result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-
     return result
 
 def _stmt(tokens):
@@ -460,16 +705,15 @@ def _stmt(tokens):
 
         stmt: simple_stmt | compound_stmt
     """
-    result = [symbol.stmt]
+    tok_type = tokens.next_type
+    tok_string = tokens.next_string
 
-    if tokens.check(token.NAME, ("if", "while", "for", "try", "with", "def", "class")) or \
-        tokens.check(token.OP, "@"):
+    if (tok_type == _NAME and tok_string in _COMPOUND_STMTS) or \
+        (tok_type == _OP and tok_string == "@"):
 
-        result.append(_compound_stmt(tokens))
+        return [_S_STMT, _compound_stmt(tokens)]
     else:
-        result.append(_simple_stmt(tokens))
-
-    return result
+        return [_S_STMT, _simple_stmt(tokens)]
 
 def _simple_stmt(tokens):
     """Parse a simple statement.
@@ -478,26 +722,23 @@ def _simple_stmt(tokens):
 
         simple_stmt: small_stmt (';' small_stmt)* [';'] NEWLINE
     """
-    result = [symbol.simple_stmt]
+    result = [_S_SIMPLE_STMT, _small_stmt(tokens)]
 
-    result.append(_small_stmt(tokens))
+    while tokens.next_type == _OP and tokens.next_string == ";":
+        result.append(tokens.accept_op(";"))
 
-    while tokens.check(token.OP, ";") and (tokens.check(token.NAME, lookahead=2) or \
-        tokens.check(token.OP, lookahead=2) or tokens.check(token.NUMBER, lookahead=2) or \
-        tokens.check(token.STRING, lookahead=2)):
+        if not tokens.next_type in _FIRST_SMALL_STMT_TYPES:
+            break
 
-        result.append(tokens.accept(token.OP, ";", result_token=token.SEMI))
         result.append(_small_stmt(tokens))
 
-    if tokens.check(token.OP, ";"):
-        result.append(tokens.accept(token.OP, ";", result_token=token.SEMI))
-
     # trailing NEWLINE is mandatory according to grammar, but in Python's parser
-    # it is optional, thus imitate this behavior
-    if tokens.check(token.NEWLINE):
-        result.append(tokens.accept(token.NEWLINE, result_name=""))
-    else:
-        result.append((token.NEWLINE, ""))
+    # it is optional, thus imitate this behavior. Either way, the parse tree
+    # reports the same leaf.
+    if tokens.next_type == _NEWLINE:
+        tokens.advance()
+
+    result.append(_NEWLINE_LEAF)
 
     return result
 
@@ -509,43 +750,25 @@ def _small_stmt(tokens):
         small_stmt: (expr_stmt | print_stmt | del_stmt | pass_stmt | flow_stmt |
                      import_stmt | global_stmt | exec_stmt | assert_stmt)
     """
-    result = [symbol.small_stmt]
-
     # pylint: disable=W0602
     global future_print_function
 
-    if tokens.check(token.NAME, "print"):
-        if future_print_function:
-            result.append(_expr_stmt(tokens))
-        else:
-            result.append(_print_stmt(tokens))
-    elif tokens.check(token.NAME, "del"):
-        result.append(_del_stmt(tokens))
-    elif tokens.check(token.NAME, "pass"):
-        result.append(_pass_stmt(tokens))
-    elif tokens.check(token.NAME, "break") or tokens.check(token.NAME, "continue") or \
-        tokens.check(token.NAME, "return") or tokens.check(token.NAME, "raise") or \
-        tokens.check(token.NAME, "yield"):
-        result.append(_flow_stmt(tokens))
-    elif tokens.check(token.NAME, ("import", "from")):
-        result.append(_import_stmt(tokens))
-    elif tokens.check(token.NAME, "global"):
-        result.append(_global_stmt(tokens))
-    elif tokens.check(token.NAME, "exec"):
-        result.append(_exec_stmt(tokens))
-    elif tokens.check(token.NAME, "assert"):
-        result.append(_assert_stmt(tokens))
-    elif tokens.check(token.OP, ("+", "-", "~", "(", "[", "{", "`")) or \
-        tokens.check(token.NUMBER) or tokens.check(token.STRING) or \
-        tokens.check(token.NAME): # make sure the "catchall" tokens.check(token.NAME) belongs to the last condition
-        result.append(_expr_stmt(tokens))
+    tok_type = tokens.next_type
+    tok_string = tokens.next_string
+
+    if tok_type == _NAME:
+        # any NAME which is not one of the statement keywords starts an expr_stmt
+        if tok_string == "print" and future_print_function:
+            return [_S_SMALL_STMT, _expr_stmt(tokens)]
+
+        return [_S_SMALL_STMT, _SMALL_STMTS.get(tok_string, _expr_stmt)(tokens)]
+    elif tok_type in _FIRST_TYPES or tok_type == _OP and tok_string in _FIRST_OPS:
+        return [_S_SMALL_STMT, _expr_stmt(tokens)]
     else:
         tokens.error("Expecting (expr_stmt | print_stmt  | del_stmt | "
                      "pass_stmt | flow_stmt | import_stmt | global_stmt | exec_stmt | "
                      "assert_stmt)")
 
-    return result
-
 def _expr_stmt(tokens):
     """Parse an expr stmt.
 
@@ -554,32 +777,28 @@ def _expr_stmt(tokens):
         expr_stmt: testlist (augassign (yield_expr|testlist) |
                              ('=' (yield_expr|testlist))*)
     """
-    result = [symbol.expr_stmt]
+    result = [_S_EXPR_STMT, _testlist(tokens)]
+    augassign = _augassign(tokens)
 
-    result.append(_testlist(tokens))
+    if augassign:
+        result.append(augassign)
 
-    if tokens.check(token.OP, ("+=", "-=", "*=", "/=", "%=", "&=", "|=", \
-                               "^=", "<<=", ">>=", "**=", "//=")):
-
-        result.append(_augassign(tokens))
-
-        if tokens.check(token.NAME, "yield"):
+        if tokens.check(_NAME, "yield"):
             result.append(_yield_expr(tokens))
         else:
             result.append(_testlist(tokens))
 
     else:
-        while tokens.check(token.OP, "="):
-            result.append(tokens.accept(token.OP, "=", result_token=token.EQUAL))
+        while tokens.check(_OP, "="):
+            result.append(tokens.accept_op("="))
 
-            if tokens.check(token.NAME, "yield"):
+            if tokens.check(_NAME, "yield"):
                 result.append(_yield_expr(tokens))
             else:
                 result.append(_testlist(tokens))
 
     return result
 
-# pylint: disable=R0912
 def _augassign(tokens):
     """Parse an augmented assign statement.
 
@@ -587,37 +806,17 @@ def _augassign(tokens):
 
         augassign: ('+=' | '-=' | '*=' | '/=' | '%=' | '&=' | '|=' | '^=' |
         '<<=' | '>>=' | '**=' | '//=')
+
+    Returns ``None`` without consuming any token if the input does not
+    continue with an augmented assignment operator.
     """
-    result = [symbol.augassign]
-
-    if tokens.check(token.OP, "+="):
-        result.append(tokens.accept(token.OP, "+=", result_token=token.PLUSEQUAL))
-    elif tokens.check(token.OP, "-="):
-        result.append(tokens.accept(token.OP, "-=", result_token=token.MINEQUAL))
-    elif tokens.check(token.OP, "*="):
-        result.append(tokens.accept(token.OP, "*=", result_token=token.STAREQUAL))
-    elif tokens.check(token.OP, "/="):
-        result.append(tokens.accept(token.OP, "/=", result_token=token.SLASHEQUAL))
-    elif tokens.check(token.OP, "%="):
-        result.append(tokens.accept(token.OP, "%=", result_token=token.PERCENTEQUAL))
-    elif tokens.check(token.OP, "&="):
-        result.append(tokens.accept(token.OP, "&=", result_token=token.AMPEREQUAL))
-    elif tokens.check(token.OP, "|="):
-        result.append(tokens.accept(token.OP, "|=", result_token=token.VBAREQUAL))
-    elif tokens.check(token.OP, "^="):
-        result.append(tokens.accept(token.OP, "^=", result_token=token.CIRCUMFLEXEQUAL))
-    elif tokens.check(token.OP, "<<="):
-        result.append(tokens.accept(token.OP, "<<=", result_token=token.LEFTSHIFTEQUAL))
-    elif tokens.check(token.OP, ">>="):
-        result.append(tokens.accept(token.OP, ">>=", result_token=token.RIGHTSHIFTEQUAL))
-    elif tokens.check(token.OP, "**="):
-        result.append(tokens.accept(token.OP, "**=", result_token=token.DOUBLESTAREQUAL))
-    elif tokens.check(token.OP, "//="):
-        result.append(tokens.accept(token.OP, "//=", result_token=token.DOUBLESLASHEQUAL))
-    else:
-        tokens.error()
+    tok_string = tokens.next_string
 
-    return result
+    if tokens.next_type != _OP or not tok_string in _AUGASSIGN_OPS:
+        return None
+
+    tokens.advance()
+    return [_S_AUGASSIGN, _AUGASSIGN_OPS[tok_string]]
 
 def _print_stmt(tokens):
     """Parse a print statement.
@@ -640,31 +839,30 @@ def _print_stmt(tokens):
     #   print_stmt: 'print' [ test (',' test)* [','] |
     #                         '>>' test [ (',' test)+ [','] ] ]
     #
-    result = [symbol.print_stmt]
-
-    result.append(tokens.accept(token.NAME, "print"))
+    result = [_S_PRINT_STMT, tokens.accept_keyword("print")]
 
     if tokens.check_test():
         result.append(_test(tokens))
 
-        while tokens.check(token.OP, ",") and tokens.check_test(lookahead=2):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-            result.append(_test(tokens))
+        while tokens.next_type == _OP and tokens.next_string == ",":
+            result.append(tokens.accept_op(","))
 
-        if tokens.check(token.OP, ","):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+            if not tokens.check_test():
+                break
+
+            result.append(_test(tokens))
 
-    elif tokens.check(token.OP, ">>"):
-        result.append(tokens.accept(token.OP, ">>", result_token=token.RIGHTSHIFT))
+    elif tokens.next_type == _OP and tokens.next_string == ">>":
+        result.append(tokens.accept_op(">>"))
         result.append(_test(tokens))
 
-        if tokens.check(token.OP, ","):
-            while tokens.check(token.OP, ",") and tokens.check_test(lookahead=2):
-                result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-                result.append(_test(tokens))
+        while tokens.next_type == _OP and tokens.next_string == ",":
+            result.append(tokens.accept_op(","))
+
+            if not tokens.check_test():
+                break
 
-            if tokens.check(token.OP, ","):
-                result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+            result.append(_test(tokens))
 
     return result
 
@@ -675,12 +873,7 @@ def _del_stmt(tokens):
 
         del_stmt: 'del' exprlist
     """
-    result = [symbol.del_stmt]
-
-    result.append(tokens.accept(token.NAME, "del"))
-    result.append(_exprlist(tokens))
-
-    return result
+    return [_S_DEL_STMT, tokens.accept_keyword("del"), _exprlist(tokens)]
 
 def _pass_stmt(tokens):
     """Parse a pass statement.
@@ -689,11 +882,7 @@ def _pass_stmt(tokens):
 
         pass_stmt: 'pass'
     """
-    result = [symbol.pass_stmt]
-
-    result.append(tokens.accept(token.NAME, "pass"))
-
-    return result
+    return [_S_PASS_STMT, tokens.accept_keyword("pass")]
 
 def _flow_stmt(tokens):
     """Parse a flow statement.
@@ -702,24 +891,14 @@ def _flow_stmt(tokens):
 
         flow_stmt: break_stmt | continue_stmt | return_stmt | raise_stmt | yield_stmt
     """
-    result = [symbol.flow_stmt]
-
-    if tokens.check(token.NAME, "break"):
-        result.append(_break_stmt(tokens))
-    elif tokens.check(token.NAME, "continue"):
-        result.append(_continue_stmt(tokens))
-    elif tokens.check(token.NAME, "return"):
-        result.append(_return_stmt(tokens))
-    elif tokens.check(token.NAME, "raise"):
-        result.append(_raise_stmt(tokens))
-    elif tokens.check(token.NAME, "yield"):
-        result.append(_yield_stmt(tokens))
+    tok_string = tokens.next_string
+
+    if tokens.next_type == _NAME and tok_string in _FLOW_STMTS:
+        return [_S_FLOW_STMT, _FLOW_STMTS[tok_string](tokens)]
     else:
         tokens.error("Expecting: break_stmt | continue_stmt | return_stmt | "
                      "raise_stmt | yield_stmt")
 
-    return result
-
 def _break_stmt(tokens):
     """Parse a break statement.
 
@@ -727,11 +906,7 @@ def _break_stmt(tokens):
 
         break_stmt: 'break'
     """
-    result = [symbol.break_stmt]
-
-    result.append(tokens.accept(token.NAME, "break"))
-
-    return result
+    return [_S_BREAK_STMT, tokens.accept_keyword("break")]
 
 def _continue_stmt(tokens):
     """Parse a continue statement.
@@ -740,11 +915,7 @@ def _continue_stmt(tokens):
 
         continue_stmt: 'continue'
     """
-    result = [symbol.continue_stmt]
-
-    result.append(tokens.accept(token.NAME, "continue"))
-
-    return result
+    return [_S_CONTINUE_STMT, tokens.accept_keyword("continue")]
 
 def _return_stmt(tokens):
     """Parse a return statement.
@@ -753,9 +924,7 @@ def _return_stmt(tokens):
 
         return_stmt: 'return' [testlist]
     """
-    result = [symbol.return_stmt]
-
-    result.append(tokens.accept(token.NAME, "return"))
+    result = [_S_RETURN_STMT, tokens.accept_keyword("return")]
 
     if tokens.check_test():
         result.append(_testlist(tokens))
@@ -769,11 +938,7 @@ def _yield_stmt(tokens):
 
         yield_stmt: yield_expr
     """
-    result = [symbol.yield_stmt]
-
-    result.append(_yield_expr(tokens))
-
-    return result
+    return [_S_YIELD_STMT, _yield_expr(tokens)]
 
 def _raise_stmt(tokens):
     """Parse a raise statement.
@@ -782,23 +947,25 @@ def _raise_stmt(tokens):
 
         raise_stmt: 'raise' [test [',' test [',' test]]]
     """
-    result = [symbol.raise_stmt]
-
-    result.append(tokens.accept(token.NAME, "raise"))
+    result = [_S_RAISE_STMT, tokens.accept_keyword("raise")]
 
     if tokens.check_test():
         result.append(_test(tokens))
 
-        if tokens.check(token.OP, ","):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+        if tokens.check(_OP, ","):
+            result.append(tokens.accept_op(","))
             result.append(_test(tokens))
 
-            if tokens.check(token.OP, ","):
-                result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+            if tokens.check(_OP, ","):
+                result.append(tokens.accept_op(","))
                 result.append(_test(tokens))
 
     return result
 
+# The alternatives of flow_stmt, see _flow_stmt()
+_FLOW_STMTS = {"break": _break_stmt, "continue": _continue_stmt,
+               "return": _return_stmt, "raise": _raise_stmt, "yield": _yield_stmt}
+
 def _import_stmt(tokens):
     """Parse an import statement.
 
@@ -806,17 +973,13 @@ def _import_stmt(tokens):
 
         import_stmt: import_name | import_from
     """
-    result = [symbol.import_stmt]
-
-    if tokens.check(token.NAME, "import"):
-        result.append(_import_name(tokens))
-    elif tokens.check(token.NAME, "from"):
-        result.append(_import_from(tokens))
+    if tokens.check(_NAME, "import"):
+        return [_S_IMPORT_STMT, _import_name(tokens)]
+    elif tokens.check(_NAME, "from"):
+        return [_S_IMPORT_STMT, _import_from(tokens)]
     else:
         tokens.error("Expecting import_name | import_from")
 
-    return result
-
 def _import_name(tokens):
     """Parse an import name.
 
@@ -824,12 +987,7 @@ def _import_name(tokens):
 
         import_name: 'import' dotted_as_names
     """
-    result = [symbol.import_name]
-
-    result.append(tokens.accept(token.NAME, "import"))
-    result.append(_dotted_as_names(tokens))
-
-    return result
+    return [_S_IMPORT_NAME, tokens.accept_keyword("import"), _dotted_as_names(tokens)]
 
 def _import_from(tokens):
     """Parse an import from.
@@ -848,30 +1006,28 @@ def _import_from(tokens):
     #   import_from: ('from' ( dotted_name | '.'+ (dotted_name | ε) )
     #                 'import' ('*' | '(' import_as_names ')' | import_as_names))
     #
-    result = [symbol.import_from]
+    result = [_S_IMPORT_FROM, tokens.accept_keyword("from")]
 
-    result.append(tokens.accept(token.NAME, "from"))
-
-    if tokens.check(token.NAME):
+    if tokens.check(_NAME):
         result.append(_dotted_name(tokens))
     else:
-        result.append(tokens.accept(token.OP, ".", result_token=token.DOT))
+        result.append(tokens.accept_op("."))
 
-        while tokens.check(token.OP, "."):
-            result.append(tokens.accept(token.OP, ".", result_token=token.DOT))
+        while tokens.check(_OP, "."):
+            result.append(tokens.accept_op("."))
 
-        if tokens.check(token.NAME) and not tokens.check(token.NAME, "import"):
+        if tokens.check(_NAME) and not tokens.check(_NAME, "import"):
             result.append(_dotted_name(tokens))
 
-    result.append(tokens.accept(token.NAME, "import"))
+    result.append(tokens.accept_keyword("import"))
 
-    if tokens.check(token.OP, "*"):
-        result.append(tokens.accept(token.OP, "*", result_token=token.STAR))
-    elif tokens.check(token.OP, "("):
-        result.append(tokens.accept(token.OP, "(", result_token=token.LPAR))
+    if tokens.check(_OP, "*"):
+        result.append(tokens.accept_op("*"))
+    elif tokens.check(_OP, "("):
+        result.append(tokens.accept_op("("))
         result.append(_import_as_names(tokens))
-        result.append(tokens.accept(token.OP, ")", result_token=token.RPAR))
-    elif tokens.check(token.NAME):
+        result.append(tokens.accept_op(")"))
+    elif tokens.check(_NAME):
         result.append(_import_as_names(tokens))
     else:
         tokens.error("Expecting ('*' | '(' import_as_names ')' | import_as_names)")
@@ -887,13 +1043,11 @@ def _import_as_name(tokens):
 
         import_as_name: NAME ['as' NAME]
     """
-    result = [symbol.import_as_name]
-
-    result.append(tokens.accept(token.NAME))
+    result = [_S_IMPORT_AS_NAME, tokens.accept(_NAME)]
 
-    if tokens.check(token.NAME, "as"):
-        result.append(tokens.accept(token.NAME, "as"))
-        result.append(tokens.accept(token.NAME))
+    if tokens.check(_NAME, "as"):
+        result.append(tokens.accept_keyword("as"))
+        result.append(tokens.accept(_NAME))
 
     return result
 
@@ -904,13 +1058,11 @@ def _dotted_as_name(tokens):
 
         dotted_as_name: dotted_name ['as' NAME]
     """
-    result = [symbol.dotted_as_name]
+    result = [_S_DOTTED_AS_NAME, _dotted_name(tokens)]
 
-    result.append(_dotted_name(tokens))
-
-    if tokens.check(token.NAME, "as"):
-        result.append(tokens.accept(token.NAME, "as"))
-        result.append(tokens.accept(token.NAME))
+    if tokens.check(_NAME, "as"):
+        result.append(tokens.accept_keyword("as"))
+        result.append(tokens.accept(_NAME))
 
     return result
 
@@ -921,16 +1073,15 @@ def _import_as_names(tokens):
 
         import_as_names: import_as_name (',' import_as_name)* [',']
     """
-    result = [symbol.import_as_names]
+    result = [_S_IMPORT_AS_NAMES, _import_as_name(tokens)]
 
-    result.append(_import_as_name(tokens))
+    while tokens.check(_OP, ","):
+        result.append(tokens.accept_op(","))
 
-    while tokens.check(token.OP, ",") and tokens.check(token.NAME, lookahead=2):
-        result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-        result.append(_import_as_name(tokens))
+        if not tokens.check(_NAME):
+            break
 
-    if tokens.check(token.OP, ","):
-        result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+        result.append(_import_as_name(tokens))
 
     return result
 
@@ -941,12 +1092,10 @@ def _dotted_as_names(tokens):
 
         dotted_as_names: dotted_as_name (',' dotted_as_name)*
     """
-    result = [symbol.dotted_as_names]
-
-    result.append(_dotted_as_name(tokens))
+    result = [_S_DOTTED_AS_NAMES, _dotted_as_name(tokens)]
 
-    while tokens.check(token.OP, ","):
-        result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+    while tokens.check(_OP, ","):
+        result.append(tokens.accept_op(","))
         result.append(_dotted_as_name(tokens))
 
     return result
@@ -958,13 +1107,11 @@ def _dotted_name(tokens):
 
         dotted_name: NAME ('.' NAME)*
     """
-    result = [symbol.dotted_name]
-
-    result.append(tokens.accept(token.NAME))
+    result = [_S_DOTTED_NAME, tokens.accept(_NAME)]
 
-    while tokens.check(token.OP, "."):
-        result.append(tokens.accept(token.OP, ".", result_token=token.DOT))
-        result.append(tokens.accept(token.NAME))
+    while tokens.check(_OP, "."):
+        result.append(tokens.accept_op("."))
+        result.append(tokens.accept(_NAME))
 
     return result
 
@@ -975,14 +1122,11 @@ def _global_stmt(tokens):
 
         global_stmt: 'global' NAME (',' NAME)*
     """
-    result = [symbol.global_stmt]
+    result = [_S_GLOBAL_STMT, tokens.accept_keyword("global"), tokens.accept(_NAME)]
 
-    result.append(tokens.accept(token.NAME, "global"))
-    result.append(tokens.accept(token.NAME))
-
-    while tokens.check(token.OP, ","):
-        result.append(tokens.accept(token.OP, result_token=token.COMMA))
-        result.append(tokens.accept(token.NAME))
+    while tokens.check(_OP, ","):
+        result.append(tokens.accept_op(","))
+        result.append(tokens.accept(_NAME))
 
     return result
 
@@ -993,17 +1137,14 @@ def _exec_stmt(tokens):
 
         exec_stmt: 'exec' expr ['in' test [',' test]]
     """
-    result = [symbol.exec_stmt]
-
-    result.append(tokens.accept(token.NAME, "exec"))
-    result.append(_expr(tokens))
+    result = [_S_EXEC_STMT, tokens.accept_keyword("exec"), _expr(tokens)]
 
-    if tokens.check(token.NAME, "in"):
-        result.append(tokens.accept(token.NAME, "in"))
+    if tokens.check(_NAME, "in"):
+        result.append(tokens.accept_keyword("in"))
         result.append(_test(tokens))
 
-        if tokens.check(token.OP, ","):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+        if tokens.check(_OP, ","):
+            result.append(tokens.accept_op(","))
             result.append(_test(tokens))
 
     return result
@@ -1015,17 +1156,21 @@ def _assert_stmt(tokens):
 
         assert_stmt: 'assert' test [',' test]
     """
-    result = [symbol.assert_stmt]
+    result = [_S_ASSERT_STMT, tokens.accept_keyword("assert"), _test(tokens)]
 
-    result.append(tokens.accept(token.NAME, "assert"))
-    result.append(_test(tokens))
-
-    if tokens.check(token.OP, ","):
-        result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+    if tokens.check(_OP, ","):
+        result.append(tokens.accept_op(","))
         result.append(_test(tokens))
 
     return result
 
+# The alternatives of small_stmt which start with a keyword, see _small_stmt()
+_SMALL_STMTS = {"print": _print_stmt, "del": _del_stmt, "pass": _pass_stmt,
+                "break": _flow_stmt, "continue": _flow_stmt, "return": _flow_stmt,
+                "raise": _flow_stmt, "yield": _flow_stmt, "import": _import_stmt,
+                "from": _import_stmt, "global": _global_stmt, "exec": _exec_stmt,
+                "assert": _assert_stmt}
+
 def _compound_stmt(tokens):
     """Parse a compound statement.
 
@@ -1033,29 +1178,23 @@ def _compound_stmt(tokens):
 
         compound_stmt: if_stmt | while_stmt | for_stmt | try_stmt | with_stmt | funcdef | classdef | decorated
     """
-    result = [symbol.compound_stmt]
-
-    if tokens.check(token.NAME, "if"):
-        result.append(_if_stmt(tokens))
-    elif tokens.check(token.NAME, "while"):
-        result.append(_while_stmt(tokens))
-    elif tokens.check(token.NAME, "for"):
-        result.append(_for_stmt(tokens))
-    elif tokens.check(token.NAME, "try"):
-        result.append(_try_stmt(tokens))
-    elif tokens.check(token.NAME, "with"):
-        result.append(_with_stmt(tokens))
-    elif tokens.check(token.NAME, "def"):
-        result.append(_funcdef(tokens))
-    elif tokens.check(token.NAME, "class"):
-        result.append(_classdef(tokens))
-    elif tokens.check(token.OP, "@"):
-        result.append(_decorated(tokens))
+    tok_type = tokens.next_type
+    tok_string = tokens.next_string
+
+    if tok_type == _NAME and tok_string in _COMPOUND_STMTS:
+        return [_S_COMPOUND_STMT, _COMPOUND_STMTS[tok_string](tokens)]
+    elif tok_type == _OP and tok_string == "@":
+        return [_S_COMPOUND_STMT, _decorated(tokens)]
     else:
         tokens.error("Expecting: if_stmt | while_stmt | for_stmt | "
                      "try_stmt | with_stmt | funcdef | classdef | decorated")
 
-    return result
+def _keyword_suite(tokens, keyword, result):
+    """Parse a ``keyword ':' suite`` clause such as ``'else' ':' suite`` and
+    append its nodes to ``result``."""
+    result.append(tokens.accept_keyword(keyword))
+    result.append(tokens.accept_op(":"))
+    result.append(_suite(tokens))
 
 def _if_stmt(tokens):
     """Parse and if statement.
@@ -1064,23 +1203,17 @@ def _if_stmt(tokens):
 
         if_stmt: 'if' test ':' suite ('elif' test ':' suite)* ['else' ':' suite]
     """
-    result = [symbol.if_stmt]
+    result = [_S_IF_STMT, tokens.accept_keyword("if"), _test(tokens),
+              tokens.accept_op(":"), _suite(tokens)]
 
-    result.append(tokens.accept(token.NAME, "if"))
-    result.append(_test(tokens))
-    result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
-    result.append(_suite(tokens))
-
-    while tokens.check(token.NAME, "elif"):
-        result.append(tokens.accept(token.NAME, "elif"))
+    while tokens.check(_NAME, "elif"):
+        result.append(tokens.accept_keyword("elif"))
         result.append(_test(tokens))
-        result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
+        result.append(tokens.accept_op(":"))
         result.append(_suite(tokens))
 
-    if tokens.check(token.NAME, "else"):
-        result.append(tokens.accept(token.NAME, "else"))
-        result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
-        result.append(_suite(tokens))
+    if tokens.check(_NAME, "else"):
+        _keyword_suite(tokens, "else", result)
 
     return result
 
@@ -1091,17 +1224,11 @@ def _while_stmt(tokens):
 
         while_stmt: 'while' test ':' suite ['else' ':' suite]
     """
-    result = [symbol.while_stmt]
-
-    result.append(tokens.accept(token.NAME, "while"))
-    result.append(_test(tokens))
-    result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
-    result.append(_suite(tokens))
+    result = [_S_WHILE_STMT, tokens.accept_keyword("while"), _test(tokens),
+              tokens.accept_op(":"), _suite(tokens)]
 
-    if tokens.check(token.NAME, "else"):
-        result.append(tokens.accept(token.NAME, "else"))
-        result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
-        result.append(_suite(tokens))
+    if tokens.check(_NAME, "else"):
+        _keyword_suite(tokens, "else", result)
 
     return result
 
@@ -1112,19 +1239,12 @@ def _for_stmt(tokens):
 
         for_stmt: 'for' exprlist 'in' testlist ':' suite ['else' ':' suite]
     """
-    result = [symbol.for_stmt]
+    result = [_S_FOR_STMT, tokens.accept_keyword("for"), _exprlist(tokens),
+              tokens.accept_keyword("in"), _testlist(tokens),
+              tokens.accept_op(":"), _suite(tokens)]
 
-    result.append(tokens.accept(token.NAME, "for"))
-    result.append(_exprlist(tokens))
-    result.append(tokens.accept(token.NAME, "in"))
-    result.append(_testlist(tokens))
-    result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
-    result.append(_suite(tokens))
-
-    if tokens.check(token.NAME, "else"):
-        result.append(tokens.accept(token.NAME, "else"))
-        result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
-        result.append(_suite(tokens))
+    if tokens.check(_NAME, "else"):
+        _keyword_suite(tokens, "else", result)
 
     return result
 
@@ -1139,32 +1259,26 @@ def _try_stmt(tokens):
                     ['finally' ':' suite] |
                    'finally' ':' suite))
     """
-    result = [symbol.try_stmt]
+    result = [_S_TRY_STMT, tokens.accept_keyword("try"),
+              tokens.accept_op(":"), _suite(tokens)]
 
-    result.append(tokens.accept(token.NAME, "try"))
-    result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
-    result.append(_suite(tokens))
+    has_except = False
 
-    if tokens.check(token.NAME, "except"):
-        while tokens.check(token.NAME, "except"):
-            result.append(_except_clause(tokens))
-            result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
-            result.append(_suite(tokens))
-
-        if tokens.check(token.NAME, "else"):
-            result.append(tokens.accept(token.NAME, "else"))
-            result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
-            result.append(_suite(tokens))
-
-        if tokens.check(token.NAME, "finally"):
-            result.append(tokens.accept(token.NAME, "finally"))
-            result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
-            result.append(_suite(tokens))
-
-    elif tokens.check(token.NAME, "finally"):
-        result.append(tokens.accept(token.NAME, "finally"))
-        result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
+    while tokens.check(_NAME, "except"):
+        result.append(_except_clause(tokens))
+        result.append(tokens.accept_op(":"))
         result.append(_suite(tokens))
+        has_except = True
+
+    if has_except:
+        if tokens.check(_NAME, "else"):
+            _keyword_suite(tokens, "else", result)
+
+        if tokens.check(_NAME, "finally"):
+            _keyword_suite(tokens, "finally", result)
+
+    elif tokens.check(_NAME, "finally"):
+        _keyword_suite(tokens, "finally", result)
 
     else:
         tokens.error("Expecting ((except_clause ':' suite)+ "
@@ -1181,16 +1295,13 @@ def _with_stmt(tokens):
 
         with_stmt: 'with' with_item (',' with_item)*  ':' suite
     """
-    result = [symbol.with_stmt]
-
-    result.append(tokens.accept(token.NAME, "with"))
-    result.append(_with_item(tokens))
+    result = [_S_WITH_STMT, tokens.accept_keyword("with"), _with_item(tokens)]
 
-    while tokens.check(token.OP, ","):
-        result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+    while tokens.check(_OP, ","):
+        result.append(tokens.accept_op(","))
         result.append(_with_item(tokens))
 
-    result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
+    result.append(tokens.accept_op(":"))
     result.append(_suite(tokens))
 
     return result
@@ -1202,12 +1313,10 @@ def _with_item(tokens):
 
         with_item: test ['as' expr]
     """
-    result = [symbol.with_item]
+    result = [_S_WITH_ITEM, _test(tokens)]
 
-    result.append(_test(tokens))
-
-    if tokens.check(token.NAME, "as"):
-        result.append(tokens.accept(token.NAME, "as"))
+    if tokens.check(_NAME, "as"):
+        result.append(tokens.accept_keyword("as"))
         result.append(_expr(tokens))
 
     return result
@@ -1219,21 +1328,16 @@ def _except_clause(tokens):
 
         except_clause: 'except' [test [('as' | ',') test]]
     """
-    result = [symbol.except_clause]
-
-    result.append(tokens.accept(token.NAME, "except"))
+    result = [_S_EXCEPT_CLAUSE, tokens.accept_keyword("except")]
 
     if tokens.check_test():
         result.append(_test(tokens))
 
-        if tokens.check(token.NAME, "as") or tokens.check(token.OP, ","):
-            if tokens.check(token.NAME, "as"):
-                result.append(tokens.accept(token.NAME, "as"))
-            elif tokens.check(token.OP, ","):
-                result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-            else:
-                tokens.error("Expecting ('as' | ',')")
-
+        if tokens.check(_NAME, "as"):
+            result.append(tokens.accept_keyword("as"))
+            result.append(_test(tokens))
+        elif tokens.check(_OP, ","):
+            result.append(tokens.accept_op(","))
             result.append(_test(tokens))
 
     return result
@@ -1245,20 +1349,16 @@ def _suite(tokens):
 
         suite: simple_stmt | NEWLINE INDENT stmt+ DEDENT
     """
-    result = [symbol.suite]
-
-    if tokens.check(token.NEWLINE):
-        result.append(tokens.accept(token.NEWLINE, result_name=""))
-        result.append(tokens.accept(token.INDENT, result_name=""))
+    result = [_S_SUITE]
 
-        try:
-            while not tokens.check(token.DEDENT):
-                result.append(_stmt(tokens))
+    if tokens.check(_NEWLINE):
+        result.append(tokens.accept_empty(_NEWLINE))
+        result.append(tokens.accept_empty(_INDENT))
 
-        except StopIteration:
-            pass # raise "Expecting DEDENT" in next block
+        while not tokens.check(_DEDENT):
+            result.append(_stmt(tokens))
 
-        result.append(tokens.accept(token.DEDENT, result_name=""))
+        result.append(tokens.accept_empty(_DEDENT))
     else:
         result.append(_simple_stmt(tokens))
 
@@ -1271,17 +1371,15 @@ def _testlist_safe(tokens):
 
         testlist_safe: old_test [(',' old_test)+ [',']]
     """
-    result = [symbol.testlist_safe]
-
-    result.append(_old_test(tokens))
+    result = [_S_TESTLIST_SAFE, _old_test(tokens)]
 
-    if tokens.check(token.OP, ","):
-        while tokens.check(token.OP, ","):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+    if tokens.check(_OP, ","):
+        while tokens.check(_OP, ","):
+            result.append(tokens.accept_op(","))
             result.append(_old_test(tokens))
 
-        if tokens.check(token.OP, ","):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+        if tokens.check(_OP, ","):
+            result.append(tokens.accept_op(","))
 
     return result
 
@@ -1292,14 +1390,10 @@ def _old_test(tokens):
 
         old_test: or_test | old_lambdef
     """
-    result = [symbol.old_test]
-
-    if tokens.check(token.NAME, "lambda"):
-        result.append(_old_lambdef(tokens))
+    if tokens.check(_NAME, "lambda"):
+        return [_S_OLD_TEST, _old_lambdef(tokens)]
     else:
-        result.append(_or_test(tokens))
-
-    return result
+        return [_S_OLD_TEST, _or_test(tokens)]
 
 def _old_lambdef(tokens):
     """Parse an old lambda definition.
@@ -1308,14 +1402,12 @@ def _old_lambdef(tokens):
 
         old_lambdef: 'lambda' [varargslist] ':' old_test
     """
-    result = [symbol.old_lambdef]
-
-    result.append(tokens.accept(token.NAME, "lambda"))
+    result = [_S_OLD_LAMBDEF, tokens.accept_keyword("lambda")]
 
-    if not tokens.check(token.OP, ":"):
+    if not tokens.check(_OP, ":"):
         result.append(_varargslist(tokens))
 
-    result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
+    result.append(tokens.accept_op(":"))
     result.append(_old_test(tokens))
 
     return result
@@ -1327,18 +1419,36 @@ def _test(tokens):
 
         test: or_test ['if' or_test 'else' test] | lambdef
     """
-    result = [symbol.test]
+    tok_type = tokens.next_type
+    tok_string = tokens.next_string
 
-    if tokens.check(token.NAME, "lambda"):
-        result.append(_lambdef(tokens))
-    else:
-        result.append(_or_test(tokens))
+    # a lone NAME, NUMBER or STRING is the most common test, its nodes are
+    # built right here instead of by a call for every level down to atom
+    # (only a NAME can be a keyword, other token strings never match)
+    if tok_type in _FIRST_TYPES and not tok_string in keywords:
+        follow_type, follow_string = tokens.peek(2)
 
-        if tokens.check(token.NAME, "if"):
-            result.append(tokens.accept(token.NAME, "if"))
-            result.append(_or_test(tokens))
-            result.append(tokens.accept(token.NAME, "else"))
-            result.append(_test(tokens))
+        if follow_type == _NEWLINE or follow_type == _ENDMARKER or \
+            (follow_type == _OP and follow_string in _TEST_FOLLOW_OPS):
+
+            tokens.advance()
+            node = [_S_ATOM, (tok_type, tok_string)]
+
+            for sym in _ATOM_TEST_LEVELS:
+                node = [sym, node]
+
+            return [_S_TEST, node]
+
+    if tok_type == _NAME and tok_string == "lambda":
+        return [_S_TEST, _lambdef(tokens)]
+
+    result = [_S_TEST, _or_test(tokens)]
+
+    if tokens.next_type == _NAME and tokens.next_string == "if":
+        result.append(tokens.accept_keyword("if"))
+        result.append(_or_test(tokens))
+        result.append(tokens.accept_keyword("else"))
+        result.append(_test(tokens))
 
     return result
 
@@ -1349,11 +1459,10 @@ def _or_test(tokens):
 
         or_test: and_test ('or' and_test)*
     """
-    result = [symbol.or_test]
-    result.append(_and_test(tokens))
+    result = [_S_OR_TEST, _and_test(tokens)]
 
-    while tokens.check(token.NAME, "or"):
-        result.append(tokens.accept(token.NAME, "or"))
+    while tokens.next_type == _NAME and tokens.next_string == "or":
+        result.append(tokens.accept_keyword("or"))
         result.append(_and_test(tokens))
 
     return result
@@ -1365,11 +1474,10 @@ def _and_test(tokens):
 
         and_test: not_test ('and' not_test)*
     """
-    result = [symbol.and_test]
-    result.append(_not_test(tokens))
+    result = [_S_AND_TEST, _not_test(tokens)]
 
-    while tokens.check(token.NAME, "and"):
-        result.append(tokens.accept(token.NAME, "and"))
+    while tokens.next_type == _NAME and tokens.next_string == "and":
+        result.append(tokens.accept_keyword("and"))
         result.append(_not_test(tokens))
 
     return result
@@ -1381,15 +1489,10 @@ def _not_test(tokens):
 
         not_test: 'not' not_test | comparison
     """
-    result = [symbol.not_test]
-
-    if tokens.check(token.NAME, "not"):
-        result.append(tokens.accept(token.NAME, "not"))
-        result.append(_not_test(tokens))
+    if tokens.next_type == _NAME and tokens.next_string == "not":
+        return [_S_NOT_TEST, tokens.accept_keyword("not"), _not_test(tokens)]
     else:
-        result.append(_comparison(tokens))
-
-    return result
+        return [_S_NOT_TEST, _comparison(tokens)]
 
 def _comparison(tokens):
     """Parse a comparison.
@@ -1398,13 +1501,13 @@ def _comparison(tokens):
 
         comparison: expr (comp_op expr)*
     """
-    result = [symbol.comparison]
-
-    result.append(_expr(tokens))
+    result = [_S_COMPARISON, _expr(tokens)]
+    comp_op = _comp_op(tokens)
 
-    while tokens.check_comp_op():
-        result.append(_comp_op(tokens))
+    while comp_op:
+        result.append(comp_op)
         result.append(_expr(tokens))
+        comp_op = _comp_op(tokens)
 
     return result
 
@@ -1414,150 +1517,90 @@ def _comp_op(tokens):
     ::
 
         comp_op: '<'|'>'|'=='|'>='|'<='|'<>'|'!='|'in'|'not' 'in'|'is'|'is' 'not'
-    """
-    result = [symbol.comp_op]
-
-    if tokens.check(token.OP, "<"):
-        result.append(tokens.accept(token.OP, "<", result_token=token.LESS))
-    elif tokens.check(token.OP, ">"):
-        result.append(tokens.accept(token.OP, ">", result_token=token.GREATER))
-    elif tokens.check(token.OP, "=="):
-        result.append(tokens.accept(token.OP, "==", result_token=token.EQEQUAL))
-    elif tokens.check(token.OP, ">="):
-        result.append(tokens.accept(token.OP, ">=", result_token=token.GREATEREQUAL))
-    elif tokens.check(token.OP, "<="):
-        result.append(tokens.accept(token.OP, "<=", result_token=token.LESSEQUAL))
-    elif tokens.check(token.OP, "<>"):
-        result.append(tokens.accept(token.OP, "<>", result_token=token.NOTEQUAL))
-    elif tokens.check(token.OP, "!="):
-        result.append(tokens.accept(token.OP, "!=", result_token=token.NOTEQUAL))
-    elif tokens.check(token.NAME, "in"):
-        result.append(tokens.accept(token.NAME, "in"))
-    elif tokens.check(token.NAME, "not") and tokens.check(token.NAME, "in", lookahead=2):
-        result.append(tokens.accept(token.NAME, "not"))
-        result.append(tokens.accept(token.NAME, "in"))
-    elif tokens.check(token.NAME, "is"):
-        result.append(tokens.accept(token.NAME, "is"))
-        if tokens.check(token.NAME, "not"):
-            result.append(tokens.accept(token.NAME, "not"))
-    else:
-        tokens.error("Expecting: '<'|'>'|'=='|'>='|'<='|'<>'|'!='|'in'|'not' 'in'|'is'|'is' 'not'")
-
-    return result
-
-def _expr(tokens):
-    """Parse an expression statement.
-
-    ::
 
-        expr: xor_expr ('|' xor_expr)*
+    Returns ``None`` without consuming any token if the input does not
+    continue with a compare operator, so that ``_comparison()`` needs no
+    separate check.
     """
-    result = [symbol.expr]
-    result.append(_xor_expr(tokens))
+    tok_type = tokens.next_type
+    tok_string = tokens.next_string
 
-    while tokens.check(token.OP, "|"):
-        result.append(tokens.accept(token.OP, "|", result_token=token.VBAR))
-        result.append(_xor_expr(tokens))
+    if tok_type == _OP:
+        if not tok_string in _COMP_OPS:
+            return None
 
-    return result
+        tokens.advance()
+        return [_S_COMP_OP, _COMP_OPS[tok_string]]
 
-def _xor_expr(tokens):
-    """Parse an xor expression statement.
+    if tok_type != _NAME:
+        return None
 
-    ::
+    result = [_S_COMP_OP]
 
-        xor_expr: and_expr ('^' and_expr)*
-    """
-    result = [symbol.xor_expr]
-    result.append(_and_expr(tokens))
+    if tok_string == "in":
+        result.append(tokens.accept_keyword("in"))
+    elif tok_string == "not":
+        if not tokens.check(_NAME, "in", lookahead=2):
+            tokens.error("Expecting: '<'|'>'|'=='|'>='|'<='|'<>'|'!='|'in'|'not' 'in'|'is'|'is' 'not'")
 
-    while tokens.check(token.OP, "^"):
-        result.append(tokens.accept(token.OP, "^", result_token=token.CIRCUMFLEX))
-        result.append(_and_expr(tokens))
+        result.append(tokens.accept_keyword("not"))
+        result.append(tokens.accept_keyword("in"))
+    elif tok_string == "is":
+        result.append(tokens.accept_keyword("is"))
+        if tokens.check(_NAME, "not"):
+            result.append(tokens.accept_keyword("not"))
+    else:
+        return None
 
     return result
 
-def _and_expr(tokens):
-    """Parse an and expression statement.
+def _expr(tokens):
+    """Parse an expression statement, including its binary operator levels.
 
     ::
 
+        expr: xor_expr ('|' xor_expr)*
+        xor_expr: and_expr ('^' and_expr)*
         and_expr: shift_expr ('&' shift_expr)*
-    """
-    result = [symbol.and_expr]
-    result.append(_shift_expr(tokens))
-
-    while tokens.check(token.OP, "&"):
-        result.append(tokens.accept(token.OP, "&", result_token=token.AMPER))
-        result.append(_shift_expr(tokens))
-
-    return result
-
-def _shift_expr(tokens):
-    """Parse a shift_expr statement
-
-    ::
-
         shift_expr: arith_expr (('<<'|'>>') arith_expr)*
-    """
-    result = [symbol.shift_expr]
-    result.append(_arith_expr(tokens))
-
-    while tokens.check(token.OP, "<<") or tokens.check(token.OP, ">>"):
-        if tokens.check(token.OP, "<<"):
-            result.append(tokens.accept(token.OP, "<<", result_token=token.LEFTSHIFT))
-        elif tokens.check(token.OP, ">>"):
-            result.append(tokens.accept(token.OP, ">>", result_token=token.RIGHTSHIFT))
-
-        result.append(_arith_expr(tokens))
-
-    return result
-
-def _arith_expr(tokens):
-    """Parse an arithmetic expression statement.
-
-    ::
-
         arith_expr: term (('+'|'-') term)*
-    """
-    result = [symbol.arith_expr]
-    result.append(_term(tokens))
-
-    while tokens.check(token.OP, "+") or tokens.check(token.OP, "-"):
-        if tokens.check(token.OP, "+"):
-            result.append(tokens.accept(token.OP, "+", result_token=token.PLUS))
-            result.append(_term(tokens))
-        elif tokens.check(token.OP, "-"):
-            result.append(tokens.accept(token.OP, "-", result_token=token.MINUS))
-            result.append(_term(tokens))
-
-    return result
-
-def _term(tokens):
-    """Parse a term statement.
-
-    ::
-
         term: factor (('*'|'/'|'%'|'//') factor)*
-    """
-    result = [symbol.term]
-    result.append(_factor(tokens))
-
-    while tokens.check(token.OP, "*") or tokens.check(token.OP, "/") or \
-          tokens.check(token.OP, "%") or tokens.check(token.OP, "//"):
-
-        if tokens.check(token.OP, "*"):
-            result.append(tokens.accept(token.OP, "*", result_token=token.STAR))
-        elif tokens.check(token.OP, "/"):
-            result.append(tokens.accept(token.OP, "/", result_token=token.SLASH))
-        elif tokens.check(token.OP, "%"):
-            result.append(tokens.accept(token.OP, "%", result_token=token.PERCENT))
-        elif tokens.check(token.OP, "//"):
-            result.append(tokens.accept(token.OP, "//", result_token=token.DOUBLESLASH))
-
-        result.append(_factor(tokens))
 
-    return result
+    The six levels are not parsed by six mutually recursive functions, but by
+    a single loop over ``_BINARY_LEVELS``. ``nodes`` holds the open node of
+    every level and ``level`` the node the next operand is appended to. Since
+    no token is consumed while going up a level, the lookahead is only peeked
+    after a factor or an operator.
+    """
+    deepest = len(_BINARY_LEVELS) - 1
+    nodes = [[level_symbol] for level_symbol, level_ops in _BINARY_LEVELS]
+    operand = _factor(tokens)
+    level = deepest
+    tok_type = tokens.next_type
+    tok_string = tokens.next_string
+
+    while True:
+        node = nodes[level]
+        node.append(operand)
+        ops = _BINARY_LEVELS[level][1]
+
+        if tok_type == _OP and tok_string in ops:
+            node.append(ops[tok_string])
+            tokens.advance()
+
+            # the right operand starts with fresh nodes on all deeper levels
+            for deeper in range(level + 1, deepest + 1):
+                nodes[deeper] = [_BINARY_LEVELS[deeper][0]]
+
+            operand = _factor(tokens)
+            level = deepest
+            tok_type = tokens.next_type
+            tok_string = tokens.next_string
+        elif level:
+            operand = node
+            level -= 1
+        else:
+            return node
 
 def _factor(tokens):
     """Parse a factor statement.
@@ -1566,21 +1609,12 @@ def _factor(tokens):
 
         factor: ('+'|'-'|'~') factor | power
     """
-    result = [symbol.factor]
-
-    if tokens.check(token.OP, "+") or tokens.check(token.OP, "-") or tokens.check(token.OP, "~"):
-        if tokens.check(token.OP, "+"):
-            result.append(tokens.accept(token.OP, "+", result_token=token.PLUS))
-        elif tokens.check(token.OP, "-"):
-            result.append(tokens.accept(token.OP, "-", result_token=token.MINUS))
-        elif tokens.check(token.OP, "~"):
-            result.append(tokens.accept(token.OP, "~", result_token=token.TILDE))
+    tok_string = tokens.next_string
 
-        result.append(_factor(tokens))
+    if tokens.next_type == _OP and tok_string in ("+", "-", "~"):
+        return [_S_FACTOR, tokens.accept_op(tok_string), _factor(tokens)]
     else:
-        result.append(_power(tokens))
-
-    return result
+        return [_S_FACTOR, _power(tokens)]
 
 def _power(tokens):
     """Parse a power statement.
@@ -1589,15 +1623,18 @@ def _power(tokens):
 
         power: atom trailer* ['**' factor]
     """
-    result = [symbol.power]
+    result = [_S_POWER, _atom(tokens)]
 
-    result.append(_atom(tokens))
+    tok_type = tokens.next_type
+    tok_string = tokens.next_string
 
-    while tokens.check(token.OP, "(") or tokens.check(token.OP, "[") or tokens.check(token.OP, "."):
+    while tok_type == _OP and tok_string in ("(", "[", "."):
         result.append(_trailer(tokens))
+        tok_type = tokens.next_type
+        tok_string = tokens.next_string
 
-    if tokens.check(token.OP, "**"):
-        result.append(tokens.accept(token.OP, "**", result_token=token.DOUBLESTAR))
+    if tok_type == _OP and tok_string == "**":
+        result.append(tokens.accept_op("**"))
         result.append(_factor(tokens))
 
     return result
@@ -1613,45 +1650,52 @@ def _atom(tokens):
                '`' testlist1 '`' |
                NAME | NUMBER | STRING+)
     """
-    result = [symbol.atom]
+    tok_type = tokens.next_type
+    tok_string = tokens.next_string
+
+    # NAME, NUMBER and STRING are by far the most common atoms, test them first
+    if tok_type == _NAME:
+        if tok_string in keywords:
+            tokens.accept(_NAME) # increment token pointer to offending token for correct error message
+            raise tokens.error("Keywords cannot appear here")
+        tokens.advance()
+        return [_S_ATOM, (tok_type, tok_string)]
+    elif tok_type == _NUMBER:
+        tokens.advance()
+        return [_S_ATOM, (tok_type, tok_string)]
+
+    result = [_S_ATOM]
 
-    if tokens.check(token.OP, "("):
-        result.append(tokens.accept(token.OP, "(", result_token=token.LPAR))
+    if tok_type == _STRING:
+        while tokens.check(_STRING):
+            result.append(tokens.accept(_STRING))
+    elif tok_type == _OP and tok_string == "(":
+        result.append(tokens.accept_op("("))
 
-        if tokens.check(token.NAME, "yield"):
+        if tokens.check(_NAME, "yield"):
             result.append(_yield_expr(tokens))
         elif tokens.check_test():
             result.append(_testlist_comp(tokens))
 
-        result.append(tokens.accept(token.OP, ")", result_token=token.RPAR))
-    elif tokens.check(token.OP, "["):
-        result.append(tokens.accept(token.OP, "[", result_token=token.LSQB))
+        result.append(tokens.accept_op(")"))
+    elif tok_type == _OP and tok_string == "[":
+        result.append(tokens.accept_op("["))
 
-        if not tokens.check(token.OP, "]"):
+        if not tokens.check(_OP, "]"):
             result.append(_listmaker(tokens))
 
-        result.append(tokens.accept(token.OP, "]", result_token=token.RSQB))
-    elif tokens.check(token.OP, "{"):
-        result.append(tokens.accept(token.OP, "{", result_token=token.LBRACE))
+        result.append(tokens.accept_op("]"))
+    elif tok_type == _OP and tok_string == "{":
+        result.append(tokens.accept_op("{"))
 
-        if not tokens.check(token.OP, "}"):
+        if not tokens.check(_OP, "}"):
             result.append(_dictorsetmaker(tokens))
 
-        result.append(tokens.accept(token.OP, "}", result_token=token.RBRACE))
-    elif tokens.check(token.OP, "`"):
-        result.append(tokens.accept(token.OP, "`", result_token=token.BACKQUOTE))
+        result.append(tokens.accept_op("}"))
+    elif tok_type == _OP and tok_string == "`":
+        result.append(tokens.accept_op("`"))
         result.append(_testlist1(tokens))
-        result.append(tokens.accept(token.OP, "`", result_token=token.BACKQUOTE))
-    elif tokens.check(token.NUMBER):
-        result.append(tokens.accept(token.NUMBER))
-    elif tokens.check(token.NAME):
-        if tokens.check(token.NAME, KEYWORDS):
-            tokens.accept(token.NAME) # increment token pointer to offending token for correct error message
-            raise tokens.error("Keywords cannot appear here")
-        result.append(tokens.accept(token.NAME))
-    elif tokens.check(token.STRING):
-        while tokens.check(token.STRING):
-            result.append(tokens.accept(token.STRING))
+        result.append(tokens.accept_op("`"))
     else:
         tokens.error("Expecting ('(' [yield_expr|testlist_comp] ')' | "
                      "'[' [listmaker] ']' | "
@@ -1668,22 +1712,24 @@ def _listmaker(tokens):
 
         listmaker: test ( list_for | (',' test)* [','] )
     """
-    result = [symbol.listmaker]
+    result = [_S_LISTMAKER, _test(tokens)]
 
-    result.append(_test(tokens))
+    tok_type = tokens.next_type
+    tok_string = tokens.next_string
 
-    if tokens.check(token.NAME, "for"):
+    if tok_type == _NAME and tok_string == "for":
         result.append(_list_for(tokens))
-    elif tokens.check(token.OP, ","):
+    elif tok_type == _OP and tok_string == ",":
         # this is a difficult one. the ',' we just matched could either be from
         # the subexpression (',' test)* or from the subexpression [','], since
         # the * operator from the first subexpression could be matching zero times.
-        while tokens.check(token.OP, ",") and tokens.check_test(lookahead=2):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-            result.append(_test(tokens))
+        while tokens.check(_OP, ","):
+            result.append(tokens.accept_op(","))
+
+            if not tokens.check_test():
+                break
 
-        if tokens.check(token.OP, ","):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+            result.append(_test(tokens))
 
     return result
 
@@ -1694,22 +1740,24 @@ def _testlist_comp(tokens):
 
         testlist_comp: test ( comp_for | (',' test)* [','] )
     """
-    result = [symbol.testlist_comp]
+    result = [_S_TESTLIST_COMP, _test(tokens)]
 
-    result.append(_test(tokens))
+    tok_type = tokens.next_type
+    tok_string = tokens.next_string
 
-    if tokens.check(token.NAME, "for"):
+    if tok_type == _NAME and tok_string == "for":
         result.append(_comp_for(tokens))
-    elif tokens.check(token.OP, ","):
+    elif tok_type == _OP and tok_string == ",":
         # this is a difficult one. the ',' we just matched could either be from
         # the subexpression (',' test)* or from the subexpression [','], since
         # the * operator from the first subexpression could be matching zero times.
-        while tokens.check(token.OP, ",") and tokens.check_test(lookahead=2):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-            result.append(_test(tokens))
+        while tokens.check(_OP, ","):
+            result.append(tokens.accept_op(","))
 
-        if tokens.check(token.OP, ","):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+            if not tokens.check_test():
+                break
+
+            result.append(_test(tokens))
 
     return result
 
@@ -1720,14 +1768,12 @@ def _lambdef(tokens):
 
         lambdef: 'lambda' [varargslist] ':' test
     """
-    result = [symbol.lambdef]
-
-    result.append(tokens.accept(token.NAME, "lambda"))
+    result = [_S_LAMBDEF, tokens.accept_keyword("lambda")]
 
-    if not tokens.check(token.OP, ":"):
+    if not tokens.check(_OP, ":"):
         result.append(_varargslist(tokens))
 
-    result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
+    result.append(tokens.accept_op(":"))
     result.append(_test(tokens))
 
     return result
@@ -1739,27 +1785,26 @@ def _trailer(tokens):
 
         trailer: '(' [arglist] ')' | '[' subscriptlist ']' | '.' NAME
     """
-    result = [symbol.trailer]
+    tok_type = tokens.next_type
+    tok_string = tokens.next_string
 
-    if tokens.check(token.OP, "("):
-        result.append(tokens.accept(token.OP, "(", result_token=token.LPAR))
+    if tok_type == _OP and tok_string == "(":
+        result = [_S_TRAILER, tokens.accept_op("(")]
 
-        if not tokens.check(token.OP, ")"):
+        if not tokens.check(_OP, ")"):
             result.append(_arglist(tokens))
 
-        result.append(tokens.accept(token.OP, ")", result_token=token.RPAR))
-    elif tokens.check(token.OP, "["):
-        result.append(tokens.accept(token.OP, "[", result_token=token.LSQB))
-        result.append(_subscriptlist(tokens))
-        result.append(tokens.accept(token.OP, "]", result_token=token.RSQB))
-    elif tokens.check(token.OP, "."):
-        result.append(tokens.accept(token.OP, ".", result_token=token.DOT))
-        result.append(tokens.accept(token.NAME))
+        result.append(tokens.accept_op(")"))
+
+        return result
+    elif tok_type == _OP and tok_string == "[":
+        return [_S_TRAILER, tokens.accept_op("["),
+                _subscriptlist(tokens), tokens.accept_op("]")]
+    elif tok_type == _OP and tok_string == ".":
+        return [_S_TRAILER, tokens.accept_op("."), tokens.accept(_NAME)]
     else:
         tokens.error("Expecting '(', '[' or '.'")
 
-    return result
-
 def _subscriptlist(tokens):
     """Parse a subscriptlist.
 
@@ -1767,17 +1812,15 @@ def _subscriptlist(tokens):
 
         subscriptlist: subscript (',' subscript)* [',']
     """
-    result = [symbol.subscriptlist]
-
-    result.append(_subscript(tokens))
+    result = [_S_SUBSCRIPTLIST, _subscript(tokens)]
 
-    while tokens.check(token.OP, ",") and (tokens.check(token.OP, (".", ":"), lookahead=2) or \
+    while tokens.check(_OP, ",") and (tokens.check_any(_OP, (".", ":"), lookahead=2) or \
         tokens.check_test(lookahead=2)):
-        result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+        result.append(tokens.accept_op(","))
         result.append(_subscript(tokens))
 
-    if tokens.check(token.OP, ","):
-        result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+    if tokens.check(_OP, ","):
+        result.append(tokens.accept_op(","))
 
     return result
 
@@ -1800,31 +1843,33 @@ def _subscript(tokens):
     #   subscript: '.' '.' '.' | test [rest] | rest
     #   rest:      ':' [test] [slicep]
     #
-    result = [symbol.subscript]
-
-    if tokens.check(token.OP, "."):
-        result.append(tokens.accept(token.OP, ".", result_token=token.DOT))
-        result.append(tokens.accept(token.OP, ".", result_token=token.DOT))
-        result.append(tokens.accept(token.OP, ".", result_token=token.DOT))
+    result = [_S_SUBSCRIPT]
+    tok_type = tokens.next_type
+    tok_string = tokens.next_string
+
+    if tok_type == _OP and tok_string == ".":
+        result.append(tokens.accept_op("."))
+        result.append(tokens.accept_op("."))
+        result.append(tokens.accept_op("."))
     elif tokens.check_test():
         result.append(_test(tokens))
 
-        if tokens.check(token.OP, ":"):
-            result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
+        if tokens.check(_OP, ":"):
+            result.append(tokens.accept_op(":"))
 
             if tokens.check_test():
                 result.append(_test(tokens))
 
-            if tokens.check(token.OP, ":"):
+            if tokens.check(_OP, ":"):
                 result.append(_sliceop(tokens))
 
-    elif tokens.check(token.OP, ":"):
-        result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
+    elif tok_type == _OP and tok_string == ":":
+        result.append(tokens.accept_op(":"))
 
         if tokens.check_test():
             result.append(_test(tokens))
 
-        if tokens.check(token.OP, ":"):
+        if tokens.check(_OP, ":"):
             result.append(_sliceop(tokens))
 
     else:
@@ -1839,9 +1884,7 @@ def _sliceop(tokens):
 
         sliceop: ':' [test]
     """
-    result = [symbol.sliceop]
-
-    result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
+    result = [_S_SLICEOP, tokens.accept_op(":")]
 
     if tokens.check_test():
         result.append(_test(tokens))
@@ -1855,16 +1898,15 @@ def _exprlist(tokens):
 
         exprlist: expr (',' expr)* [',']
     """
-    result = [symbol.exprlist]
+    result = [_S_EXPRLIST, _expr(tokens)]
 
-    result.append(_expr(tokens))
+    while tokens.check(_OP, ","):
+        result.append(tokens.accept_op(","))
 
-    while tokens.check(token.OP, ",") and tokens.check_expr(lookahead=2):
-        result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-        result.append(_expr(tokens))
+        if not tokens.check_expr():
+            break
 
-    if tokens.check(token.OP, ","):
-        result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+        result.append(_expr(tokens))
 
     return result
 
@@ -1875,16 +1917,15 @@ def _testlist(tokens):
 
         testlist: test (',' test)* [',']
     """
-    result = [symbol.testlist]
+    result = [_S_TESTLIST, _test(tokens)]
 
-    result.append(_test(tokens))
+    while tokens.next_type == _OP and tokens.next_string == ",":
+        result.append(tokens.accept_op(","))
 
-    while tokens.check(token.OP, ",") and tokens.check_test(lookahead=2):
-        result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-        result.append(_test(tokens))
+        if not tokens.check_test():
+            break
 
-    if tokens.check(token.OP, ","):
-        result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+        result.append(_test(tokens))
 
     return result
 
@@ -1909,34 +1950,33 @@ def _dictorsetmaker(tokens):
     #                          | comp_for
     #                          | (',' test)* [',']) )
     #
-    result = [symbol.dictorsetmaker]
+    result = [_S_DICTORSETMAKER, _test(tokens)]
 
-    result.append(_test(tokens))
-
-    if tokens.check(token.OP, ":"):
-        result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
+    if tokens.check(_OP, ":"):
+        result.append(tokens.accept_op(":"))
         result.append(_test(tokens))
 
-        if tokens.check(token.NAME, "for"):
+        if tokens.check(_NAME, "for"):
             result.append(_comp_for(tokens))
-        elif tokens.check(token.OP, ","):
-            while tokens.check(token.OP, ",") and tokens.check_test(lookahead=2):
-                result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+        elif tokens.check(_OP, ","):
+            while tokens.check(_OP, ",") and tokens.check_test(lookahead=2):
+                result.append(tokens.accept_op(","))
                 result.append(_test(tokens))
-                result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
+                result.append(tokens.accept_op(":"))
                 result.append(_test(tokens))
 
-            if tokens.check(token.OP, ","):
-                result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-    elif tokens.check(token.NAME, "for"):
+            if tokens.check(_OP, ","):
+                result.append(tokens.accept_op(","))
+    elif tokens.check(_NAME, "for"):
         result.append(_comp_for(tokens))
-    elif tokens.check(token.OP, ","):
-        while tokens.check(token.OP, ",") and tokens.check_test(lookahead=2):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-            result.append(_test(tokens))
+    elif tokens.check(_OP, ","):
+        while tokens.check(_OP, ","):
+            result.append(tokens.accept_op(","))
 
-        if tokens.check(token.OP, ","):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+            if not tokens.check_test():
+                break
+
+            result.append(_test(tokens))
 
     return result
 
@@ -1947,24 +1987,27 @@ def _classdef(tokens):
 
             classdef: 'class' NAME ['(' [testlist] ')'] ':' suite
     """
-    result = [symbol.classdef]
-
-    result.append(tokens.accept(token.NAME, "class"))
-    result.append(tokens.accept(token.NAME))
+    result = [_S_CLASSDEF, tokens.accept_keyword("class"), tokens.accept(_NAME)]
 
-    if tokens.check(token.OP, "("):
-        result.append(tokens.accept(token.OP, "(", result_token=token.LPAR))
+    if tokens.check(_OP, "("):
+        result.append(tokens.accept_op("("))
 
-        if not tokens.check(token.OP, ")"):
+        if not tokens.check(_OP, ")"):
             result.append(_testlist(tokens))
 
-        result.append(tokens.accept(token.OP, ")", result_token=token.RPAR))
+        result.append(tokens.accept_op(")"))
 
-    result.append(tokens.accept(token.OP, ":", result_token=token.COLON))
+    result.append(tokens.accept_op(":"))
     result.append(_suite(tokens))
 
     return result
 
+# The alternatives of compound_stmt which start with a keyword, see
+# _compound_stmt() and _stmt()
+_COMPOUND_STMTS = {"if": _if_stmt, "while": _while_stmt, "for": _for_stmt,
+                   "try": _try_stmt, "with": _with_stmt, "def": _funcdef,
+                   "class": _classdef}
+
 def _arglist(tokens):
     """Parse an argument list.
 
@@ -2024,52 +2067,55 @@ def _arglist(tokens):
     #            | '*' test (',' argument)* [',' '**' test]
     #            | '**' test) )
     #
-    result = [symbol.arglist]
+    result = [_S_ARGLIST]
 
     if tokens.check_test():
         result.append(_argument(tokens))
 
-        while tokens.check(token.OP, ",") and tokens.check_test(lookahead=2):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+        while tokens.check(_OP, ",") and tokens.check_test(lookahead=2):
+            result.append(tokens.accept_op(","))
             result.append(_argument(tokens))
 
-        if tokens.check(token.OP, ",") and tokens.check(token.OP, ("*"), lookahead=2):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-            result.append(tokens.accept(token.OP, "*", result_token=token.STAR))
-            result.append(_test(tokens))
-
-            while tokens.check(token.OP, ",") and tokens.check_test(lookahead=2):
-                result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-                result.append(_argument(tokens))
+        if tokens.check(_OP, ","):
+            tok = tokens.peek(lookahead=2)
 
-            if tokens.check(token.OP, ","):
-                result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-                result.append(tokens.accept(token.OP, "**", result_token=token.DOUBLESTAR))
+            if tok[0] == _OP and tok[1] == "*":
+                result.append(tokens.accept_op(","))
+                result.append(tokens.accept_op("*"))
                 result.append(_test(tokens))
 
-        elif tokens.check(token.OP, ",") and tokens.check(token.OP, ("**"), lookahead=2):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-            result.append(tokens.accept(token.OP, "**", result_token=token.DOUBLESTAR))
-            result.append(_test(tokens))
+                while tokens.check(_OP, ",") and tokens.check_test(lookahead=2):
+                    result.append(tokens.accept_op(","))
+                    result.append(_argument(tokens))
+
+                if tokens.check(_OP, ","):
+                    result.append(tokens.accept_op(","))
+                    result.append(tokens.accept_op("**"))
+                    result.append(_test(tokens))
+
+            elif tok[0] == _OP and tok[1] == "**":
+                result.append(tokens.accept_op(","))
+                result.append(tokens.accept_op("**"))
+                result.append(_test(tokens))
 
-        elif tokens.check(token.OP, ","):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+            else:
+                result.append(tokens.accept_op(","))
 
-    elif tokens.check(token.OP, "*"):
-        result.append(tokens.accept(token.OP, "*", result_token=token.STAR))
+    elif tokens.check(_OP, "*"):
+        result.append(tokens.accept_op("*"))
         result.append(_test(tokens))
 
-        while tokens.check(token.OP, ",") and tokens.check_test(lookahead=2):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+        while tokens.check(_OP, ",") and tokens.check_test(lookahead=2):
+            result.append(tokens.accept_op(","))
             result.append(_argument(tokens))
 
-        if tokens.check(token.OP, ","):
-            result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
-            result.append(tokens.accept(token.OP, "**", result_token=token.DOUBLESTAR))
+        if tokens.check(_OP, ","):
+            result.append(tokens.accept_op(","))
+            result.append(tokens.accept_op("**"))
             result.append(_test(tokens))
 
-    elif tokens.check(token.OP, "**"):
-        result.append(tokens.accept(token.OP, "**", result_token=token.DOUBLESTAR))
+    elif tokens.check(_OP, "**"):
+        result.append(tokens.accept_op("**"))
         result.append(_test(tokens))
 
     else:
@@ -2090,14 +2136,15 @@ def _argument(tokens):
     #   argument: test option
     #   option:   ε | comp_for | '=' test
     #
-    result = [symbol.argument]
+    result = [_S_ARGUMENT, _test(tokens)]
 
-    result.append(_test(tokens))
+    tok_type = tokens.next_type
+    tok_string = tokens.next_string
 
-    if tokens.check(token.NAME, "for"):
+    if tok_type == _NAME and tok_string == "for":
         result.append(_comp_for(tokens))
-    elif tokens.check(token.OP, "="):
-        result.append(tokens.accept(token.OP, "=", result_token=token.EQUAL))
+    elif tok_type == _OP and tok_string == "=":
+        result.append(tokens.accept_op("="))
         result.append(_test(tokens))
 
     return result
@@ -2109,17 +2156,13 @@ def _list_iter(tokens):
 
         list_iter: list_for | list_if
     """
-    result = [symbol.list_iter]
-
-    if tokens.check(token.NAME, "for"):
-        result.append(_list_for(tokens))
-    elif tokens.check(token.NAME, "if"):
-        result.append(_list_if(tokens))
+    if tokens.check(_NAME, "for"):
+        return [_S_LIST_ITER, _list_for(tokens)]
+    elif tokens.check(_NAME, "if"):
+        return [_S_LIST_ITER, _list_if(tokens)]
     else:
         tokens.error("Expecting list_for | list_if")
 
-    return result
-
 def _list_for(tokens):
     """Parse a list for.
 
@@ -2127,14 +2170,10 @@ def _list_for(tokens):
 
         list_for: 'for' exprlist 'in' testlist_safe [list_iter]
     """
-    result = [symbol.list_for]
-
-    result.append(tokens.accept(token.NAME, "for"))
-    result.append(_exprlist(tokens))
-    result.append(tokens.accept(token.NAME, "in"))
-    result.append(_testlist_safe(tokens))
+    result = [_S_LIST_FOR, tokens.accept_keyword("for"), _exprlist(tokens),
+              tokens.accept_keyword("in"), _testlist_safe(tokens)]
 
-    if tokens.check(token.NAME, "for") or tokens.check(token.NAME, "if"):
+    if tokens.check_any(_NAME, ("for", "if")):
         result.append(_list_iter(tokens))
 
     return result
@@ -2146,12 +2185,9 @@ def _list_if(tokens):
 
         list_if: 'if' old_test [list_iter]
     """
-    result = [symbol.list_if]
+    result = [_S_LIST_IF, tokens.accept_keyword("if"), _old_test(tokens)]
 
-    result.append(tokens.accept(token.NAME, "if"))
-    result.append(_old_test(tokens))
-
-    if tokens.check(token.NAME, "for") or tokens.check(token.NAME, "if"):
+    if tokens.check_any(_NAME, ("for", "if")):
         result.append(_list_iter(tokens))
 
     return result
@@ -2163,17 +2199,13 @@ def _comp_iter(tokens):
 
         comp_iter: comp_for | comp_if
     """
-    result = [symbol.comp_iter]
-
-    if tokens.check(token.NAME, "for"):
-        result.append(_comp_for(tokens))
-    elif tokens.check(token.NAME, "if"):
-        result.append(_comp_if(tokens))
+    if tokens.check(_NAME, "for"):
+        return [_S_COMP_ITER, _comp_for(tokens)]
+    elif tokens.check(_NAME, "if"):
+        return [_S_COMP_ITER, _comp_if(tokens)]
     else:
         tokens.error("Expecting comp_for | comp_if")
 
-    return result
-
 def _comp_for(tokens):
     """Parse a for generator expression.
 
@@ -2181,14 +2213,10 @@ def _comp_for(tokens):
 
         comp_for: 'for' exprlist 'in' or_test [comp_iter]
     """
-    result = [symbol.comp_for]
+    result = [_S_COMP_FOR, tokens.accept_keyword("for"), _exprlist(tokens),
+              tokens.accept_keyword("in"), _or_test(tokens)]
 
-    result.append(tokens.accept(token.NAME, "for"))
-    result.append(_exprlist(tokens))
-    result.append(tokens.accept(token.NAME, "in"))
-    result.append(_or_test(tokens))
-
-    if tokens.check(token.NAME, ("for", "if")):
+    if tokens.check_any(_NAME, ("for", "if")):
         result.append(_comp_iter(tokens))
 
     return result
@@ -2200,12 +2228,9 @@ def _comp_if(tokens):
 
         comp_if: 'if' old_test [comp_iter]
     """
-    result = [symbol.comp_if]
+    result = [_S_COMP_IF, tokens.accept_keyword("if"), _old_test(tokens)]
 
-    result.append(tokens.accept(token.NAME, "if"))
-    result.append(_old_test(tokens))
-
-    if tokens.check(token.NAME, ("for", "if")):
+    if tokens.check_any(_NAME, ("for", "if")):
         result.append(_comp_iter(tokens))
 
     return result
@@ -2217,12 +2242,10 @@ def _testlist1(tokens):
 
         testlist1: test (',' test)*
     """
-    result = [symbol.testlist1]
-
-    result.append(_test(tokens))
+    result = [_S_TESTLIST1, _test(tokens)]
 
-    while tokens.check(token.OP, ","):
-        result.append(tokens.accept(token.OP, ",", result_token=token.COMMA))
+    while tokens.check(_OP, ","):
+        result.append(tokens.accept_op(","))
         result.append(_test(tokens))
 
     return result
@@ -2234,11 +2257,7 @@ def _encoding_decl(tokens):
 
         encoding_decl: NAME
     """
-    result = [symbol.encoding_decl]
-
-    result.append(tokens.coding)
-
-    return result
+    return [_S_ENCODING_DECL, tokens.coding]
 
 def _yield_expr(tokens):
     """Parse a yield expression.
@@ -2247,9 +2266,7 @@ def _yield_expr(tokens):
 
         yield_expr: 'yield' [testlist]
     """
-    result = [symbol.yield_expr]
-
-    result.append(tokens.accept(token.NAME, "yield"))
+    result = [_S_YIELD_EXPR, tokens.accept_keyword("yield")]
 
     if tokens.check_test():
         result.append(_testlist(tokens))
@@ -2262,7 +2279,10 @@ class TokenIterator(object):
     are skipped from the input.
     """
 
-    def __init__(self, generator, skip_tokens=(tokenize.NL, token.N_TOKENS)):
+    __slots__ = ("filename", "coding", "next_type", "next_string",
+                 "_values", "_types", "_strings", "_length", "_index")
+
+    def __init__(self, generator, skip_tokens=(_NL, _N_TOKENS)):
         self._index = -1
         self.filename = "<string>"
         self.coding = None
@@ -2272,7 +2292,7 @@ class TokenIterator(object):
 
         for tok in toks:
             lineno = tok[2][0]
-            if tok[0] == token.N_TOKENS and lineno in (1, 2):
+            if tok[0] == _N_TOKENS and lineno in (1, 2):
                 match = coding.match(tok[1])
                 if match:
                     self.coding = match.group(1).lower()
@@ -2282,57 +2302,148 @@ class TokenIterator(object):
         if self.coding in ENCODING_ALIASES:
             self.coding = ENCODING_ALIASES[self.coding]
 
-        self._values = [tok for tok in toks if tok[0] not in skip_tokens]
+        # the token stream is filtered once and frozen, so that checking and
+        # accepting tokens is plain index arithmetic. Token types and strings,
+        # which is all the parser looks at, are kept in two parallel arrays.
+        # Token types are below N_TOKENS, so a signed char holds each of them
+        # and the -1 appended below. The complete tokens are only kept for
+        # reporting syntax errors.
+        self._values = tuple([tok for tok in toks if tok[0] not in skip_tokens])
+        self._types = array("b", [tok[0] for tok in self._values])
+        self._strings = [tok[1] for tok in self._values]
+        self._length = len(self._values)
+
+        # Type and string of the next token are kept in attributes as well,
+        # which is cheaper to read than peek(). Both arrays end with an extra
+        # entry, so that there always is a next token to take them from.
+        self._types.append(-1)
+        self._strings.append(None)
+        self.next_type = self._types[0]
+        self.next_string = self._strings[0]
 
     def check(self, token_type, token_name=None, lookahead=1):
-        if self._index + lookahead >= len(self._values):
+        index = self._index + lookahead
+
+        if index >= self._length or self._types[index] != token_type:
             return False
 
-        tok = self._values[self._index + lookahead]
+        return not token_name or self._strings[index] == token_name
 
-        if tok[0] != token_type:
+    def check_any(self, token_type, token_names, lookahead=1):
+        """Like ``check()``, but the token may match any of ``token_names``"""
+        index = self._index + lookahead
+
+        if index >= self._length or self._types[index] != token_type:
             return False
 
-        if token_name:
-            if isinstance(token_name, basestring):
-                if tok[1] != token_name:
-                    return False
+        return self._strings[index] in token_names
+
+    def accept(self, token_type, token_name=None, result_name=None, error_msg=None):
+        index = self._index + 1
+
+        if index >= self._length or self._types[index] != token_type or \
+            (not token_name is None and self._strings[index] != token_name):
+
+            # the error message is only formatted once a token is rejected,
+            # accepting a token does not pay for it
+            if not error_msg:
+                if not token_name:
+                    error_msg = "Expecting %s" % token.tok_name[token_type]
+                else:
+                    error_msg = "Expecting '%s'" % token_name
+
+            if index < self._length:
+                self.error(error_msg, tok=self._values[index])
             else:
-                if tok[1] not in token_name:
-                    return False
+                self.error(error_msg, tok=None)
 
-        return True
+        if result_name is None:
+            result_name = self._strings[index]
+
+        result = (token_type, result_name)
+
+        self._index = index
+        self.next_type = self._types[index + 1]
+        self.next_string = self._strings[index + 1]
+
+        return result
 
-    # pylint: disable=R0913
-    def accept(self, token_type, token_name=None, result_token=None, result_name=None, error_msg=None):
-        if not error_msg:
-            if not token_name:
-                error_msg = "Expecting %s" % token.tok_name[token_type]
+    def accept_op(self, op):
+        """Accept the operator ``op`` like ``accept(OP, op, ...)`` does, but
+        return its shared leaf from ``_OP_LEAVES``."""
+        index = self._index + 1
+
+        if index >= self._length or self._types[index] != _OP or \
+            self._strings[index] != op:
+
+            if index < self._length:
+                self.error("Expecting '%s'" % op, tok=self._values[index])
             else:
-                error_msg = "Expecting '%s'" % token_name
+                self.error("Expecting '%s'" % op, tok=None)
 
-        if self._index + 1 >= len(self._values):
-            self.error(error_msg)
+        self._index = index
+        self.next_type = self._types[index + 1]
+        self.next_string = self._strings[index + 1]
 
-        tok = self._values[self._index + 1]
+        return _OP_LEAVES[op]
 
-        if tok[0] != token_type:
-            self.error(error_msg, tok=tok)
+    def accept_keyword(self, keyword):
+        """Accept the keyword ``keyword`` like ``accept(NAME, keyword)`` does,
+        but return its shared leaf from ``_KEYWORD_LEAVES``."""
+        index = self._index + 1
 
-        if not token_name is None and (tok[1] != token_name):
-            self.error(error_msg, tok=tok)
+        if index >= self._length or self._types[index] != _NAME or \
+            self._strings[index] != keyword:
 
-        if result_token is None:
-            result_token = tok[0]
+            if index < self._length:
+                self.error("Expecting '%s'" % keyword, tok=self._values[index])
+            else:
+                self.error("Expecting '%s'" % keyword, tok=None)
 
-        if result_name is None:
-            result_name = tok[1]
+        self._index = index
+        self.next_type = self._types[index + 1]
+        self.next_string = self._strings[index + 1]
 
-        result = (result_token, result_name)
+        return _KEYWORD_LEAVES[keyword]
 
-        self._index = self._index + 1
+    def accept_empty(self, token_type):
+        """Accept a NEWLINE, INDENT, DEDENT or ENDMARKER token like
+        ``accept(token_type, result_name="")`` does, but return its shared
+        leaf from ``_EMPTY_LEAVES``."""
+        index = self._index + 1
 
-        return result
+        if index >= self._length or self._types[index] != token_type:
+            error_msg = "Expecting %s" % token.tok_name[token_type]
+
+            if index < self._length:
+                self.error(error_msg, tok=self._values[index])
+            else:
+                self.error(error_msg, tok=None)
+
+        self._index = index
+        self.next_type = self._types[index + 1]
+        self.next_string = self._strings[index + 1]
+
+        return _EMPTY_LEAVES[token_type]
+
+    def peek(self, lookahead=1):
+        """Return type and string of the next token (or the one ``lookahead``
+        tokens ahead) without accepting it. Past the end of the input, a token
+        of type ``None`` is returned."""
+        index = self._index + lookahead
+
+        if index >= self._length:
+            return _NO_TOKEN
+
+        return (self._types[index], self._strings[index])
+
+    def advance(self):
+        """Accept the next token without checking it, for callers which have
+        already peeked at it and know that it matches."""
+        index = self._index + 1
+        self._index = index
+        self.next_type = self._types[index + 1]
+        self.next_string = self._strings[index + 1]
 
     def error(self, error_msg=None, tok=None):
         if not tok:
@@ -2347,21 +2458,31 @@ class TokenIterator(object):
 
     def check_test(self, lookahead=1):
         """Shorthand notation to check whether next statement is a ``test``"""
-        return self.check(token.NAME, "not", lookahead=lookahead) or \
-            self.check(token.OP, ("+", "-", "~", "(", "[", "{", "`"), lookahead=lookahead) or \
-            self.check(token.NAME, lookahead=lookahead) or \
-            self.check(token.NUMBER, lookahead=lookahead) or \
-            self.check(token.STRING, lookahead=lookahead)
+        index = self._index + lookahead
 
-    def check_comp_op(self):
-        """Shorthand notation to check whether next statement is a ``comp_op``"""
-        return self.check(token.OP, ("<", ">", "==", ">=", "<=", "<>", "!=")) or \
-            self.check(token.NAME, ("in", "not", "is"))
+        if index >= self._length:
+            return False
+
+        tok_type = self._types[index]
+
+        if tok_type == _OP:
+            return self._strings[index] in _FIRST_OPS
+
+        return tok_type in _FIRST_TYPES
 
     def check_expr(self, lookahead=1):
         """Shorthand notation to check whether next statement is an ``expr``"""
-        return (self.check(token.OP, ("+", "-", "~", "(", "[", "{", "`"), lookahead=lookahead) or \
-            self.check(token.NAME, lookahead=lookahead) or \
-            self.check(token.NUMBER, lookahead=lookahead) or \
-            self.check(token.STRING, lookahead=lookahead)) and not \
-            self.check(token.NAME, KEYWORDS, lookahead=lookahead)
+        index = self._index + lookahead
+
+        if index >= self._length:
+            return False
+
+        tok_type = self._types[index]
+
+        if tok_type == _OP:
+            return self._strings[index] in _FIRST_OPS
+
+        if tok_type == _NAME:
+            return not self._strings[index] in keywords
+
+        return tok_type in _FIRST_TYPES
@@ -89,7 +89,31 @@ class TestParser(unittest.TestCase):
         self.assertEquals(parser.suite(source).totuple(),
                           pycep.parser.suite(source, totuple=True))
 
+    def test_print_function_not_inherited(self):
+        source = open(path.join(SNIPPETS, "neg", "print_function.py")).read()
+        pycep.parser.suite(source)
+        self.assertRaises(SyntaxError, pycep.parser.suite, "x = print\n")
+        pycep.parser._cache.clear() # parse again, not from the cache
+        pycep.parser.suite(source)
+        self.assertRaises(SyntaxError, pycep.parser.expr, "print")
+
+    def test_cached_parse_tree(self):
+        source = open(path.join(SAMPLE_PROGRAMS, "fib.py")).read()
+        self.assertTrue(pycep.parser.suite(source, totuple=True) is
+                        pycep.parser.suite(source, totuple=True))
+
+    def test_cached_parse_tree_print_function(self):
+        source = open(path.join(SNIPPETS, "neg", "print_function.py")).read()
+        pycep.parser.suite(source)
+        pycep.parser.suite("x = 1\n")
+        self.assertRaises(SyntaxError, pycep.parser.expr, "print")
+
     def test_eval_input(self):
         code = "x+1"
         self.assertEquals(parser.expr(code).totuple(),
                           pycep.parser.expr(code, totuple=True))
+
+    def test_eval_input_name(self):
+        code = "x"
+        self.assertEquals(parser.expr(code).totuple(),
+                          pycep.parser.expr(code, totuple=True))
@@ -1,4 +1,36 @@
 from setuptools import setup
+from setuptools.command.build_ext import build_ext
+from distutils import log
+from distutils.errors import CCompilerError, DistutilsExecError, DistutilsPlatformError
+
+try:
+    from Cython.Build import cythonize
+    from Cython.Compiler.Errors import CompileError
+except ImportError:
+    cythonize = None
+
+# The parser is kept as plain Python source. When Cython is available, the
+# very same module is additionally compiled to a C extension, otherwise (or
+# if Cython fails to translate it) the pure Python module is used as-is.
+ext_modules = []
+
+if cythonize:
+    try:
+        ext_modules = cythonize(["pycep/parser.py"],
+                                compiler_directives={"boundscheck": False,
+                                                     "language_level": 2})
+    except CompileError:
+        log.warn("could not cythonize the parser, using the pure Python module")
+
+class optional_build_ext(build_ext):
+    """Build the C extensions, but fall back to the pure Python modules
+    instead of failing if there is no working C compiler."""
+
+    def run(self):
+        try:
+            build_ext.run(self)
+        except (CCompilerError, DistutilsExecError, DistutilsPlatformError):
+            self.warn("could not compile the C extensions, using the pure Python modules")
 
 setup(
     name = "pycep",
@@ -13,5 +45,7 @@ setup(
     ],
     entry_points = {
         'console_scripts': ['pycep=pycep.cli:main'],
-    }
+    },
+    ext_modules = ext_modules,
+    cmdclass = {"build_ext": optional_build_ext}
 )